@@ -3,3 +3,11 @@ from django.apps import AppConfig
 
 class AccountsConfig(AppConfig):
     name = 'accounts'
+
+    def ready(self):
+        # Import and build AUTH_PASSWORD_VALIDATORS once at startup.
+        # The result is cached, so the first registration request doesn't
+        # pay for it (e.g. CommonPasswordValidator loading its word list).
+        from django.contrib.auth import password_validation
+
+        password_validation.get_default_password_validators()
@@ -0,0 +1,104 @@
+"""
+Accounts Authentication Backends
+================================
+This file defines the authentication backend used for login and sessions.
+
+Why a Custom Backend?
+- ModelBackend loads the full CustomUser row on every login and on every
+  authenticated request (get_user() runs once per request via the session)
+- Most of those columns (date_joined, ...) are never used by the auth
+  path or the templates
+
+Key Concepts:
+- authenticate(): Look up user by email and check the password (login)
+- get_user(): Load the logged-in user from the session (every request)
+- only(): Fetch just the listed columns; others load lazily if accessed
+"""
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.backends import ModelBackend
+
+from .models import CustomUser
+
+
+# Columns needed by login, sessions, permission checks and display names.
+# Anything else is deferred and fetched with an extra query when accessed.
+AUTH_USER_FIELDS = (
+    "id",
+    "email",
+    "password",  # check_password() and the session auth hash
+    "is_active",  # user_can_authenticate()
+    "last_login",  # updated on login
+    "is_staff",  # admin access
+    "is_superuser",  # permission checks
+    "first_name",  # get_short_name() / get_full_name(), e.g. the admin header
+    "last_name",  # get_full_name()
+)
+
+
+# ============================================================
+# SLIM MODEL BACKEND
+# ============================================================
+class SlimModelBackend(ModelBackend):
+    """
+    ModelBackend that only loads the columns listed in AUTH_USER_FIELDS.
+
+    Behaviour is otherwise the same as ModelBackend:
+        - Inactive users can't log in or stay logged in
+        - Unknown emails still run the password hasher once, so response
+          time doesn't reveal which emails are registered
+        - Permissions, groups and has_perm() work unchanged
+    """
+
+    def _users(self):
+        """CustomUser queryset restricted to the auth columns."""
+        return CustomUser._default_manager.only(*AUTH_USER_FIELDS)
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        """Verify email + password (sync version)."""
+        if username is None:
+            username = kwargs.get(CustomUser.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+        try:
+            user = self._users().get(**{CustomUser.USERNAME_FIELD: username})
+        except CustomUser.DoesNotExist:
+            # Same timing protection as ModelBackend (Django ticket #20760)
+            CustomUser().set_password(password)
+            return None
+        if user.check_password(password) and self.user_can_authenticate(user):
+            return user
+        return None
+
+    async def aauthenticate(self, request, username=None, password=None, **kwargs):
+        """Verify email + password (async version, used by login_view)."""
+        if username is None:
+            username = kwargs.get(CustomUser.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+        try:
+            user = await self._users().aget(**{CustomUser.USERNAME_FIELD: username})
+        except CustomUser.DoesNotExist:
+            # Same timing protection as ModelBackend (Django ticket #20760),
+            # hashed in a thread so it doesn't block the event loop
+            await sync_to_async(CustomUser().set_password)(password)
+            return None
+        if await user.acheck_password(password) and self.user_can_authenticate(user):
+            return user
+        return None
+
+    def get_user(self, user_id):
+        """Load the logged-in user for the current request (sync version)."""
+        try:
+            user = self._users().get(pk=user_id)
+        except CustomUser.DoesNotExist:
+            return None
+        return user if self.user_can_authenticate(user) else None
+
+    async def aget_user(self, user_id):
+        """Load the logged-in user for the current request (async version)."""
+        try:
+            user = await self._users().aget(pk=user_id)
+        except CustomUser.DoesNotExist:
+            return None
+        return user if self.user_can_authenticate(user) else None
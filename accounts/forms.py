@@ -19,6 +19,17 @@ from .models import CustomUser
 from django.contrib.auth.forms import UserCreationForm
 
 
+# ============================================================
+# SHARED WIDGETS
+# ============================================================
+# Built once at import and reused by the fields below.
+# Bootstrap "form-control" class for styling.
+# Each field keeps its own copy of the widget, so sharing them is safe.
+TEXT_WIDGET = forms.TextInput(attrs={"class": "form-control"})
+EMAIL_WIDGET = forms.EmailInput(attrs={"class": "form-control"})
+PASSWORD_WIDGET = forms.PasswordInput(attrs={"class": "form-control"})
+
+
 # ============================================================
 # CUSTOM USER REGISTRATION FORM
 # ============================================================
@@ -52,7 +63,7 @@ class CustomUserCreationForm(UserCreationForm):
     # EmailField: Validates email format (must contain @, valid domain, etc.)
     email = forms.EmailField(
         label="email",  # Label shown above field
-        widget=forms.EmailInput(attrs={"class": "form-control"}),  # Bootstrap styling
+        widget=EMAIL_WIDGET,  # Bootstrap styling
         required=True,  # User must provide email
     )
 
@@ -60,7 +71,7 @@ class CustomUserCreationForm(UserCreationForm):
     # CharField: Regular text input
     first_name = forms.CharField(
         label="first name",
-        widget=forms.TextInput(attrs={"class": "form-control"}),  # Bootstrap styling
+        widget=TEXT_WIDGET,  # Bootstrap styling
         required=True,  # User must provide first name
     )
 
@@ -68,7 +79,7 @@ class CustomUserCreationForm(UserCreationForm):
     # CharField: Regular text input
     last_name = forms.CharField(
         label="last name",
-        widget=forms.TextInput(attrs={"class": "form-control"}),  # Bootstrap styling
+        widget=TEXT_WIDGET,  # Bootstrap styling
         required=True,  # User must provide last name
     )
 
@@ -77,9 +88,7 @@ class CustomUserCreationForm(UserCreationForm):
     # Inherited from UserCreationForm but customized here
     password1 = forms.CharField(
         label="password",
-        widget=forms.PasswordInput(
-            attrs={"class": "form-control"},  # Bootstrap styling
-        ),
+        widget=PASSWORD_WIDGET,  # Bootstrap styling
     )
 
     # ========== PASSWORD CONFIRMATION FIELD ==========
@@ -87,9 +96,7 @@ class CustomUserCreationForm(UserCreationForm):
     # Form validation checks that password1 == password2
     password2 = forms.CharField(
         label="confirm password",
-        widget=forms.PasswordInput(
-            attrs={"class": "form-control"},  # Bootstrap styling
-        ),
+        widget=PASSWORD_WIDGET,  # Bootstrap styling
     )
 
     class Meta:
@@ -0,0 +1,45 @@
+"""
+Accounts Password Hashers
+=========================
+This file defines the password hasher used for new passwords.
+
+Why a Custom Hasher?
+- Hashing runs on every login (authenticate()) and registration (form.save())
+- Django's Argon2 defaults (100 MiB, 8 lanes) are tuned for large servers
+- We want a bounded, predictable cost per login (well under 500 ms)
+
+Key Concepts:
+- time_cost: Number of passes over memory
+- memory_cost: Memory used per hash, in KiB
+- parallelism: Number of lanes (threads) used per hash
+"""
+
+from django.contrib.auth.hashers import Argon2PasswordHasher
+
+
+# ============================================================
+# TUNED ARGON2 HASHER
+# ============================================================
+class FastArgon2PasswordHasher(Argon2PasswordHasher):
+    """
+    Argon2id hasher using OWASP's 46 MiB profile (m=47104, t=1, p=1).
+
+    Parameters:
+        - time_cost = 1: One pass over memory
+        - memory_cost = 47104: 46 MiB per hash
+        - parallelism = 1: Single lane (one CPU core per login)
+
+    Notes:
+        - Keeps the "argon2" algorithm name, so hashes made with Django's
+          default Argon2 parameters still verify and get re-hashed with
+          these parameters on the next successful login.
+        - Re-measure on the target host after changing parameters and
+          aim for roughly 300 ms per hash:
+          python manage.py shell -c "import timeit;
+          from django.contrib.auth.hashers import make_password;
+          print(timeit.timeit(lambda: make_password('x'), number=10) / 10)"
+    """
+
+    time_cost = 1
+    memory_cost = 47104
+    parallelism = 1
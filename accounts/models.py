@@ -14,6 +14,9 @@ Key Concepts:
 - USERNAME_FIELD: Tells Django which field to use for login
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.auth.hashers import make_password
 from django.db import models
 from django.contrib.auth.base_user import BaseUserManager
 from django.contrib.auth.models import AbstractUser
@@ -101,6 +104,54 @@ class CustomUserManager(BaseUserManager):
         # Create user using create_user method
         return self.create_user(email, password, **extra_fields)
 
+    def bulk_create_users(self, rows, workers=None, batch_size=1000):
+        """
+        Create many users at once (e.g. an admin import).
+
+        Parameters:
+            - rows: Iterable of dicts with "email", "password" and
+              optionally "extra" (dict of other fields, e.g. first_name)
+            - workers: Number of hashing threads (None = Python's default,
+              based on the CPU count)
+            - batch_size: Users per INSERT statement
+
+        Returns:
+            List of created User objects
+
+        Why Faster Than create_user() in a Loop?
+            - Password hashing is the slow part (tens of ms per user, see
+              accounts/hashers.py). Argon2/PBKDF2 run in C and release the
+              GIL, so a thread
+              pool hashes on all CPU cores (threads instead of processes:
+              no pickling and no Django setup per worker)
+            - All rows go in with bulk_create (one INSERT per batch)
+              instead of one INSERT per user
+
+        Note:
+            - bulk_create() bypasses save(), so emails are lowercased here
+            - No post_save signals are sent for the created users, so
+              they don't get the empty Cart made at signup
+              (store/signals.py); the cart views create it on first use
+              (Cart.objects.get_or_create)
+        """
+        rows = list(rows)
+        for row in rows:
+            if not row.get("email"):
+                raise ValueError(_("Email must be set."))
+
+        with ThreadPoolExecutor(workers) as executor:
+            hashes = list(executor.map(make_password, (r["password"] for r in rows)))
+
+        users = [
+            self.model(
+                email=self.normalize_email(row["email"]).lower(),
+                password=password_hash,
+                **row.get("extra", {}),
+            )
+            for row, password_hash in zip(rows, hashes)
+        ]
+        return self.bulk_create(users, batch_size=batch_size)
+
 
 # ============================================================
 # CUSTOM USER MODEL
@@ -130,6 +181,8 @@ class CustomUser(AbstractUser):
     username = None
 
     # Email field - unique and required for login
+    # unique=True also indexes it, which serves the exact-match lookup done
+    # at login (emails are stored and looked up lowercased)
     email = models.EmailField(
         _("Email Address"), unique=True  # No two users can have same email
     )
@@ -147,10 +200,26 @@ class CustomUser(AbstractUser):
     # Use our custom manager instead of default
     objects = CustomUserManager()
 
+    # Email as loaded from the database (None for users not saved yet)
+    _loaded_email = None
+
     def __str__(self):
         """String representation of user (shown in admin and queries)"""
         return self.email
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Remember the email loaded from the database.
+
+        save() uses it to skip re-normalizing an unchanged email, e.g. on
+        the last_login update that runs on every login.
+        """
+        instance = super().from_db(db, field_names, values)
+        # Read from __dict__ so a deferred email isn't fetched here
+        instance._loaded_email = instance.__dict__.get("email")
+        return instance
+
     def save(self, *args, **kwargs):
         """
         Override save method to normalize email to lowercase.
@@ -159,13 +228,17 @@ class CustomUser(AbstractUser):
             - Convert email to lowercase before saving
             - Prevents duplicates like "User@Email.com" and "user@email.com"
             - Ensures consistent email format
+            - Only runs when the email is new or changed since loading
 
         Example:
             User enters: "John@Example.COM"
             Stored as: "john@example.com"
         """
-        if self.email:
-            self.email = self.email.lower()  # Convert to lowercase
+        email = self.__dict__.get("email")
+        email_changed = bool(email) and email != self._loaded_email
+        if email_changed:
+            self.email = email.lower()  # Convert to lowercase
 
         # Call parent save method to actually save to database
         super().save(*args, **kwargs)
+        self._loaded_email = self.__dict__.get("email")
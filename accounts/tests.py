@@ -1,3 +1,151 @@
-from django.test import TestCase
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import SESSION_KEY, base_user, get_user
+from django.test import RequestFactory, TestCase
+from django.urls import reverse
+
+from store.models import Cart
+
+from .models import CustomUser
+
+
+class LoginViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user("buyer@example.com", "s3cret-pass")
+
+    def login(self, **data):
+        return self.client.post(reverse("accounts:loginpage"), data, follow=True)
+
+    def messages(self, response):
+        return [str(m) for m in response.context["messages"]]
+
+    def test_valid_login(self):
+        response = self.login(email=" Buyer@Example.com ", password="s3cret-pass")
+
+        self.assertRedirects(response, reverse("store:homepage"))
+        self.assertEqual(int(self.client.session[SESSION_KEY]), self.user.pk)
+        self.assertEqual(self.messages(response), ["Logged in successful"])
+        # Without "Remember Me" the session ends when the browser closes
+        self.assertTrue(self.client.session.get_expire_at_browser_close())
+
+    def test_remember_me(self):
+        self.login(email="buyer@example.com", password="s3cret-pass", remember="on")
+
+        self.assertFalse(self.client.session.get_expire_at_browser_close())
+
+    def test_wrong_password(self):
+        response = self.login(email="buyer@example.com", password="wrong-pass")
+
+        self.assertNotIn(SESSION_KEY, self.client.session)
+        self.assertEqual(self.messages(response), ["Email or Password is invalid"])
+
+    def test_unknown_email_still_runs_hasher(self):
+        # The hasher runs for unknown emails too, so the response time
+        # doesn't reveal whether an email is registered
+        with mock.patch.object(
+            base_user, "make_password", wraps=base_user.make_password
+        ) as make_password:
+            response = self.login(email="nobody@example.com", password="s3cret-pass")
+
+        make_password.assert_called_once_with("s3cret-pass")
+        self.assertNotIn(SESSION_KEY, self.client.session)
+        self.assertEqual(self.messages(response), ["Email or Password is invalid"])
+
+    def test_registered_user_can_log_in_straight_away(self):
+        self.login(email="new@example.com", password="s3cret-pass")
+        CustomUser.objects.create_user("new@example.com", "s3cret-pass")
+
+        response = self.login(email="new@example.com", password="s3cret-pass")
+
+        self.assertRedirects(response, reverse("store:homepage"))
+
+
+class AsyncLoginViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user("buyer@example.com", "s3cret-pass")
+
+    async def login(self, **data):
+        return await self.async_client.post(reverse("accounts:loginpage"), data)
+
+    async def test_valid_login(self):
+        response = await self.login(email="buyer@example.com", password="s3cret-pass")
+
+        self.assertRedirects(response, reverse("store:homepage"), fetch_redirect_response=False)
+        session = await self.async_client.asession()
+        self.assertEqual(int(await session.aget(SESSION_KEY)), self.user.pk)
+
+    async def test_invalid_login(self):
+        response = await self.login(email="nobody@example.com", password="s3cret-pass")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Email or Password is invalid")
+        session = await self.async_client.asession()
+        self.assertIsNone(await session.aget(SESSION_KEY))
+
+    async def test_get_renders_form(self):
+        response = await self.async_client.get(reverse("accounts:loginpage"))
+
+        self.assertTemplateUsed(response, "login.html")
+
+
+class SessionUserTests(TestCase):
+    def test_loading_user_is_one_query(self):
+        user = CustomUser.objects.create_user(
+            "buyer@example.com", "s3cret-pass", first_name="Sita", last_name="Rai"
+        )
+        self.client.force_login(user)
+        request = RequestFactory().get("/")
+        request.session = self.client.session
+        request.session.keys()  # Load the session before counting queries
+
+        # One query loads the user; what the auth path, permission checks
+        # and display names read must not trigger deferred-field queries
+        with self.assertNumQueries(1):
+            loaded = get_user(request)
+            self.assertEqual(loaded.pk, user.pk)
+            self.assertEqual(loaded.email, "buyer@example.com")
+            self.assertEqual(loaded.get_short_name(), "Sita")
+            self.assertEqual(loaded.get_full_name(), "Sita Rai")
+            self.assertTrue(loaded.is_active)
+            self.assertFalse(loaded.is_staff or loaded.is_superuser)
+
+
+class BulkCreateUsersTests(TestCase):
+    def test_creates_users(self):
+        users = CustomUser.objects.bulk_create_users(
+            [
+                {"email": "One@Example.COM", "password": "first-pass"},
+                {
+                    "email": "two@example.com",
+                    "password": "second-pass",
+                    "extra": {"first_name": "Two"},
+                },
+            ],
+            workers=2,
+        )
+
+        self.assertEqual([u.email for u in users], ["one@example.com", "two@example.com"])
+        one = CustomUser.objects.get(email="one@example.com")
+        self.assertTrue(one.check_password("first-pass"))
+        self.assertFalse(one.check_password("second-pass"))
+        self.assertEqual(CustomUser.objects.get(email="two@example.com").first_name, "Two")
+
+    def test_missing_email(self):
+        with self.assertRaises(ValueError):
+            CustomUser.objects.bulk_create_users(
+                [
+                    {"email": "one@example.com", "password": "first-pass"},
+                    {"email": "", "password": "second-pass"},
+                ]
+            )
+
+        # Rows are checked before anything is hashed or inserted
+        self.assertFalse(CustomUser.objects.exists())
+
+    def test_no_signup_cart(self):
+        CustomUser.objects.bulk_create_users([{"email": "one@example.com", "password": "first-pass"}])
+
+        # No post_save signal, so no cart until the cart views create one
+        self.assertFalse(Cart.objects.filter(user__email="one@example.com").exists())
@@ -16,12 +16,37 @@ Django Authentication:
 - @login_required: Decorator to protect views (must be logged in)
 """
 
+from functools import lru_cache
+
+from asgiref.sync import sync_to_async
 from django.shortcuts import render, redirect
 from django.urls import reverse
 from .forms import CustomUserCreationForm
 from django.contrib import messages
-from django.contrib.auth import authenticate, login, logout
+from django.contrib.auth import aauthenticate, alogin, logout
 from django.contrib.auth.decorators import login_required
+from django.views.decorators.cache import cache_page
+from django.views.decorators.vary import vary_on_headers
+
+# Unbound registration form shared by all GET requests
+# An unbound form has no data or errors, and rendering it doesn't change
+# it, so one instance can be reused instead of deep-copying the form's
+# fields on every page load. POST requests still get their own bound form.
+_EMPTY_REGISTER_FORM = CustomUserCreationForm()
+
+
+# ============================================================
+# HELPER FUNCTIONS
+# ============================================================
+@lru_cache(maxsize=8)
+def _url(name):
+    """
+    Memoized reverse() for the fixed redirect targets used below.
+
+    reverse() walks the URL resolver on every call; these URLs never
+    change while the process runs, so resolve each name only once.
+    """
+    return reverse(name)
 
 
 # ============================================================
@@ -63,11 +88,11 @@ def register_view(request):
             )
 
             # Redirect to login page
-            return redirect(reverse("accounts:loginpage"))
+            return redirect(_url("accounts:loginpage"))
         # If form is invalid, it will show errors automatically
     else:
-        # GET request - show empty form
-        form = CustomUserCreationForm()
+        # GET request - show empty form (shared instance, see above)
+        form = _EMPTY_REGISTER_FORM
 
     context = {
         "form": form,  # Pass form to template
@@ -78,7 +103,7 @@ def register_view(request):
 # ============================================================
 # USER LOGIN VIEW
 # ============================================================
-def login_view(request):
+async def login_view(request):
     """
     Handle user login (authentication).
 
@@ -86,6 +111,12 @@ def login_view(request):
     Template: login.html
     Methods: GET (show form), POST (process login)
 
+    Async View:
+        - Uses aauthenticate()/alogin(), which run the password hasher in a
+          thread pool, so an ASGI worker keeps serving other requests while
+          a login is being hashed
+        - Also works under WSGI (Django runs it in an event loop per request)
+
     Purpose:
         - Display login form
         - Verify user credentials (email + password)
@@ -96,6 +127,9 @@ def login_view(request):
         - Email is automatically converted to lowercase
         - Remember Me checkbox controls session duration
         - Shows error messages for invalid credentials
+        - Unknown emails still run the password hasher (see
+          SlimModelBackend), so response time doesn't reveal which emails
+          are registered
 
     Logic Flow:
         1. If POST request (login attempt):
@@ -108,7 +142,7 @@ def login_view(request):
     """
     # Optional: Uncomment to redirect already logged-in users
     # if request.user.is_authenticated:
-    #     return redirect(reverse('store:homepage'))
+    #     return redirect(_url('store:homepage'))
 
     if request.method == "POST":
         # Get form data
@@ -118,31 +152,36 @@ def login_view(request):
         remember_me = request.POST.get("remember")  # Checkbox value
 
         # Verify credentials - returns User object if valid, None if invalid
-        user = authenticate(request, email=email, password=password)
+        # Always called, also for unknown emails: skipping the hasher for
+        # them would make those logins measurably faster and reveal which
+        # emails are registered
+        user = await aauthenticate(request, email=email, password=password)
 
         if user is not None:
             # Credentials are valid - log user in
             # This creates a session and sets session cookies
-            login(request, user)
+            await alogin(request, user)
 
             # Handle "Remember Me" functionality
             if not remember_me:
                 # If "Remember Me" is NOT checked:
                 # Session expires when browser closes
-                request.session.set_expiry(0)
+                await request.session.aset_expiry(0)
             # If checked: Session uses default expiration (2 weeks)
 
             # Show success message
             messages.success(request, "Logged in successful")
 
             # Redirect to homepage
-            return redirect(reverse("store:homepage"))
+            return redirect(_url("store:homepage"))
         else:
             # Invalid credentials - show error
             messages.error(request, "Email or Password is invalid")
 
     # GET request or failed login - show login form
-    return render(request, "login.html")
+    # Rendered in a thread: the header reads request.user, which may query
+    # the database and that isn't allowed directly in async code
+    return await sync_to_async(render)(request, "login.html")
 
 
 # ============================================================
@@ -167,7 +206,7 @@ def logout_view(request):
     logout(request)
 
     # Redirect to login page
-    return redirect(reverse("accounts:loginpage"))
+    return redirect(_url("accounts:loginpage"))
 
 
 # ============================================================
@@ -182,15 +221,17 @@ def home_view(request):
         - If user is not logged in, redirects to LOGIN_URL (settings.py)
         - If user is logged in, allows access to view
 
-    Note: This view currently just redirects to base.html
+    Note: This view currently just redirects to the homepage
           Consider removing if not used.
     """
-    return redirect(reverse("base.html"))
+    return redirect(_url("store:homepage"))
 
 
 # ============================================================
 # CONTACT PAGE VIEW
 # ============================================================
+@cache_page(60 * 60)  # Cache the rendered page for 1 hour
+@vary_on_headers("Cookie")  # Separate cache entry per session/messages cookie
 def contact_view(request):
     """
     Display contact page.
@@ -202,6 +243,11 @@ def contact_view(request):
         - Show contact information
         - Display contact form (if implemented)
 
+    Caching:
+        - The page has no dynamic data, so the rendered HTML is cached
+        - Varies on Cookie because the header shows the logged-in user
+          and base.html shows flash messages
+
     Note:
         - Currently just renders template
         - Could be enhanced to handle contact form submissions
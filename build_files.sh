@@ -1,3 +1,12 @@
 #!/bin/bash
 pip install -r requirements.txt
 python manage.py collectstatic --noinput
+
+# Apply migrations once per deploy when using a persistent database
+# (for hosts that run this script; Vercel's config doesn't, so there
+# project/wsgi.py migrates on cold start instead)
+if [ -n "$POSTGRES_HOST" ]; then
+    python manage.py migrate --noinput
+    # Product image variants that don't exist yet (existing ones are skipped)
+    python manage.py generateimages store:product
+fi
@@ -0,0 +1,8 @@
+import os
+
+# Load the Celery app when a broker is configured, so tasks queued from web
+# requests (e.g. product image variants) use its settings
+if os.environ.get('CELERY_BROKER_URL'):
+    from .celery import app as celery_app
+
+    __all__ = ('celery_app',)
@@ -0,0 +1,23 @@
+"""
+Celery config for project project.
+
+Background worker for slow jobs that shouldn't run inside a web request,
+currently generating the resized product image variants (django-imagekit).
+
+Only used when CELERY_BROKER_URL is set (see settings.py). Start a worker:
+    celery -A project worker
+"""
+
+import os
+
+from celery import Celery
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'project.settings')
+
+app = Celery('project')
+
+# Read every CELERY_* setting from settings.py
+app.config_from_object('django.conf:settings', namespace='CELERY')
+
+# Find tasks.py modules in installed apps
+app.autodiscover_tasks()
@@ -59,6 +59,8 @@ INSTALLED_APPS = [
     "django.contrib.sessions",  # Session framework (remember logged-in users)
     "django.contrib.messages",  # Messaging framework (flash messages)
     "django.contrib.staticfiles",  # Serve static files (CSS, JS, images)
+    # Third-party apps
+    "imagekit",  # Resized WebP/AVIF variants of product images
     # Custom apps for this project
     "store",  # E-commerce store app (products, cart, etc.)
     "accounts",  # User accounts app (login, register, etc.)
@@ -75,7 +77,8 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",  # Security enhancements
-     'whitenoise.middleware.WhiteNoiseMiddleware',  # Serve static files efficiently in production
+    "whitenoise.middleware.WhiteNoiseMiddleware",  # Serve static files (right after SecurityMiddleware)
+    "store.middleware.MediaCacheHeadersMiddleware",  # Cache-Control for /media/ files
     "django.contrib.sessions.middleware.SessionMiddleware",  # Session support
     "django.middleware.common.CommonMiddleware",  # Common features
     "django.middleware.csrf.CsrfViewMiddleware",  # CSRF protection
@@ -108,15 +111,26 @@ TEMPLATES = [
         # Directories where Django looks for templates
         # common_templates/ contains base.html, header.html, etc.
         "DIRS": [os.path.join(BASE_DIR, "common_templates")],
-        # Allow apps to have their own 'templates' folders
-        # Django will look in: app_name/templates/
-        "APP_DIRS": True,
-        # Context processors add variables to all templates
         "OPTIONS": {
+            # Context processors add variables to all templates
             "context_processors": [
                 "django.template.context_processors.request",  # Access 'request' in templates
                 "django.contrib.auth.context_processors.auth",  # Access 'user' in templates
                 "django.contrib.messages.context_processors.messages",  # Access messages
+                "store.context_processors.cart",  # Access cart_product_ids (lazy)
+            ],
+            # Template loaders (replaces APP_DIRS, which can't be combined with "loaders")
+            # cached.Loader parses each template once per process and reuses it,
+            # instead of reading and compiling the file on every render.
+            # In development the cache is cleared automatically when a template changes.
+            "loaders": [
+                (
+                    "django.template.loaders.cached.Loader",
+                    [
+                        "django.template.loaders.filesystem.Loader",  # DIRS above
+                        "django.template.loaders.app_directories.Loader",  # app_name/templates/
+                    ],
+                ),
             ],
         },
     },
@@ -124,12 +138,17 @@ TEMPLATES = [
 
 
 # ============================================================
-# WSGI CONFIGURATION
+# WSGI / ASGI CONFIGURATION
 # ============================================================
 # WSGI (Web Server Gateway Interface) application
-# Used when deploying with production servers like Gunicorn
+# Used when deploying with production servers like Gunicorn (and on Vercel)
 WSGI_APPLICATION = "project.wsgi.application"
 
+# ASGI (Asynchronous Server Gateway Interface) application
+# Used with async servers, e.g.: uvicorn project.asgi:application
+# Async views such as login_view then don't block a worker while hashing
+ASGI_APPLICATION = "project.asgi.application"
+
 
 # ============================================================
 # DATABASE CONFIGURATION
@@ -137,14 +156,42 @@ WSGI_APPLICATION = "project.wsgi.application"
 # Database settings
 # https://docs.djangoproject.com/en/6.0/ref/settings/#databases
 
-# Using SQLite for development (single file database)
-# For production, consider PostgreSQL or MySQL
-# On Vercel, /tmp/ is the only writable directory
-if os.environ.get('VERCEL'):
+# SQLite connection options
+# WAL journal lets readers keep working while a request writes (e.g. the
+# session write at login) instead of waiting on SQLite's global write lock.
+# synchronous=NORMAL is safe in WAL mode and avoids an fsync per commit.
+SQLITE_OPTIONS = {
+    "init_command": "PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL",
+}
+
+# Production: PostgreSQL, enabled by setting POSTGRES_HOST
+# (same variable names as Vercel Postgres; requires psycopg)
+# Development: SQLite (single file database)
+# On Vercel without Postgres, /tmp/ is the only writable directory
+if os.environ.get('POSTGRES_HOST'):
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.postgresql",
+            "NAME": os.environ.get('POSTGRES_DATABASE', 'postgres'),
+            "USER": os.environ.get('POSTGRES_USER', 'postgres'),
+            "PASSWORD": os.environ.get('POSTGRES_PASSWORD', ''),
+            "HOST": os.environ['POSTGRES_HOST'],
+            "PORT": os.environ.get('POSTGRES_PORT', '5432'),
+            # Keep connections open for 60s instead of reconnecting per request
+            "CONN_MAX_AGE": 60,
+            # Check a reused connection is still alive before using it
+            "CONN_HEALTH_CHECKS": True,
+            # Set POSTGRES_PGBOUNCER=True when connecting through pgbouncer
+            # in transaction pooling mode (server-side cursors don't work there)
+            "DISABLE_SERVER_SIDE_CURSORS": os.environ.get('POSTGRES_PGBOUNCER') == 'True',
+        }
+    }
+elif os.environ.get('VERCEL'):
     DATABASES = {
         "default": {
             "ENGINE": "django.db.backends.sqlite3",
             "NAME": "/tmp/db.sqlite3",
+            "OPTIONS": SQLITE_OPTIONS,
         }
     }
 else:
@@ -152,6 +199,31 @@ else:
         "default": {
             "ENGINE": "django.db.backends.sqlite3",  # Database type
             "NAME": BASE_DIR / "db.sqlite3",  # Database file location
+            "OPTIONS": SQLITE_OPTIONS,
+        }
+    }
+
+
+# ============================================================
+# CACHE CONFIGURATION
+# ============================================================
+# Cache used by per-view caching (cache_page) and low-level cache calls
+# https://docs.djangoproject.com/en/6.0/topics/cache/
+
+# Set REDIS_URL in production so every worker shares one cache
+# (requires the redis package). Otherwise each process keeps its own
+# in-memory cache, which is fine for development.
+if os.environ.get('REDIS_URL'):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.environ['REDIS_URL'],
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
         }
     }
 
@@ -182,6 +254,27 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# ============================================================
+# PASSWORD HASHING
+# ============================================================
+# Hashers used to store and verify passwords
+# https://docs.djangoproject.com/en/6.0/topics/auth/passwords/
+#
+# The first hasher is used for all new passwords (requires argon2-cffi).
+# The others are only kept so existing hashes can still be verified;
+# they are upgraded to the first hasher on the user's next successful login.
+#
+# FastArgon2PasswordHasher (accounts/hashers.py) uses Argon2id with
+# time_cost=1, memory_cost=46 MiB, parallelism=1 (OWASP's 46 MiB profile)
+# so a login hash stays well under a 500 ms budget.
+PASSWORD_HASHERS = [
+    "accounts.hashers.FastArgon2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+]
+
+
 # ============================================================
 # INTERNATIONALIZATION
 # ============================================================
@@ -222,13 +315,26 @@ STATICFILES_DIRS = [os.path.join(BASE_DIR, "static")]  # Example: static/css/sty
 # Static files path
 STATIC_ROOT = os.path.join(BASE_DIR, "staticfiles")
 
-# WhiteNoise storage backend for serving static files efficiently
+# Storage backends
+# "default" handles uploaded media (product images); it must be listed
+# because defining STORAGES replaces Django's built-in defaults entirely.
+# "staticfiles": WhiteNoise writes gzip (and brotli, if installed) copies
+# and content-hashed names (style.3f2a1b.css) during collectstatic.
 STORAGES = {
+    "default": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+    },
     "staticfiles": {
         "BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage",
     },
 }
 
+# Browser cache lifetime (seconds) for static files WITHOUT a content hash
+# Hashed files from the manifest are always served with a 1-year
+# "immutable" Cache-Control header by WhiteNoise, regardless of this value.
+# Unhashed files can change under the same URL, so keep them short-lived.
+WHITENOISE_MAX_AGE = 0 if DEBUG else 60 * 60 * 24  # 1 day in production
+
 
 # ============================================================
 # MEDIA FILES CONFIGURATION (User-uploaded files)
@@ -243,6 +349,56 @@ MEDIA_ROOT = BASE_DIR / "media"
 # Files will be accessible at /media/products/image.jpg
 MEDIA_URL = "/media/"
 
+# Resized product image variants (django-imagekit, see store/images.py)
+# Generated when a product image is saved, never while a page renders
+# (store.images.GenerateOnSave); pages use the original image until a
+# product's variants exist. With a Celery worker (CELERY_BROKER_URL) the
+# encodes are queued instead, so saving a product in the admin doesn't
+# wait for six image encodes.
+# Existing images: "python manage.py generateimages" (run by build_files.sh)
+IMAGEKIT_DEFAULT_CACHEFILE_STRATEGY = "store.images.GenerateOnSave"
+if os.environ.get('CELERY_BROKER_URL'):
+    IMAGEKIT_DEFAULT_CACHEFILE_BACKEND = "imagekit.cachefiles.backends.Celery"
+
+
+# ============================================================
+# CELERY (BACKGROUND TASKS)
+# ============================================================
+# Enabled by setting CELERY_BROKER_URL, e.g. redis://localhost:6379/1
+# (requires celery[redis]; see project/celery.py)
+CELERY_BROKER_URL = os.environ.get('CELERY_BROKER_URL')
+# imagekit sends its jobs pickled; our broker only receives our own jobs
+CELERY_ACCEPT_CONTENT = ["json", "pickle"]
+CELERY_TASK_IGNORE_RESULT = True
+# Register imagekit's generate task (it isn't in a tasks.py module)
+CELERY_IMPORTS = ("imagekit.cachefiles.backends",)
+
+# Production: product images on Amazon S3, enabled by setting
+# AWS_STORAGE_BUCKET_NAME (requires django-storages[boto3]; credentials are
+# read by boto3 from AWS_ACCESS_KEY_ID / AWS_SECRET_ACCESS_KEY)
+# Images are then served by S3 / the CDN instead of a Django worker.
+USE_S3_MEDIA = bool(os.environ.get('AWS_STORAGE_BUCKET_NAME'))
+if USE_S3_MEDIA:
+    STORAGES["default"] = {"BACKEND": "storages.backends.s3.S3Storage"}
+    AWS_STORAGE_BUCKET_NAME = os.environ['AWS_STORAGE_BUCKET_NAME']
+    AWS_S3_REGION_NAME = os.environ.get('AWS_S3_REGION_NAME')
+    # CDN domain in front of the bucket, e.g. d123.cloudfront.net
+    AWS_S3_CUSTOM_DOMAIN = os.environ.get('AWS_S3_CUSTOM_DOMAIN')
+    # Plain public URLs (no expiring signatures) so the CDN can cache them
+    AWS_QUERYSTRING_AUTH = False
+    AWS_DEFAULT_ACL = None  # Bucket policy decides access
+    # Never replace an existing file: a new upload with the same name gets
+    # a new name, which makes it safe to cache every object "forever"
+    AWS_S3_FILE_OVERWRITE = False
+    AWS_S3_OBJECT_PARAMETERS = {
+        "CacheControl": "public, max-age=31536000, immutable",
+    }
+    MEDIA_URL = (
+        f"https://{AWS_S3_CUSTOM_DOMAIN}/"
+        if AWS_S3_CUSTOM_DOMAIN
+        else f"https://{AWS_STORAGE_BUCKET_NAME}.s3.amazonaws.com/"
+    )
+
 
 # ============================================================
 # DEFAULT PRIMARY KEY FIELD TYPE
@@ -261,3 +417,47 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 # URL to redirect users to when they need to log in
 # Used by @login_required decorator
 LOGIN_URL = "/accounts/login/"
+
+# Same as Django's ModelBackend, but only loads the user columns the auth
+# path actually needs (see accounts/backends.py)
+AUTHENTICATION_BACKENDS = ["accounts.backends.SlimModelBackend"]
+
+
+# ============================================================
+# SESSION SETTINGS
+# ============================================================
+# https://docs.djangoproject.com/en/6.0/topics/http/sessions/
+# With a shared cache (REDIS_URL), cached_db reads sessions from the cache
+# and only falls back to the database on a cache miss, so authenticated
+# requests normally skip the django_session query. Writes still go to the
+# database, so sessions survive cache restarts, and logging out deletes
+# the session from the one cache every worker reads.
+# Without it, each process has its own in-memory cache: a logout would
+# only clear the worker that handled it, and the others would keep
+# accepting the session. So the plain database backend is used then.
+if os.environ.get('REDIS_URL'):
+    SESSION_ENGINE = "django.contrib.sessions.backends.cached_db"
+else:
+    SESSION_ENGINE = "django.contrib.sessions.backends.db"
+
+# Session cookie can't be read by JavaScript (Django's default, set explicitly)
+SESSION_COOKIE_HTTPONLY = True
+
+# Only send the session cookie over HTTPS in production
+# (development runs on plain http://127.0.0.1:8000, so it stays off there)
+SESSION_COOKIE_SECURE = not DEBUG
+
+# Only write the session when it was actually modified (Django's default,
+# set explicitly so it isn't switched on by accident). With True, every
+# request - including plain page views - would write django_session.
+SESSION_SAVE_EVERY_REQUEST = False
+
+
+# ============================================================
+# MESSAGES SETTINGS
+# ============================================================
+# Flash messages ("Logged in successful", etc.) are kept in a signed cookie
+# The default FallbackStorage uses the cookie too, but falls back to the
+# session (a database write) for large messages. Ours are short one-liners,
+# so cookie-only storage means messages never touch the session store.
+MESSAGE_STORAGE = "django.contrib.messages.storage.cookie.CookieStorage"
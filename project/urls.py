@@ -44,12 +44,13 @@ urlpatterns = [
 # This allows accessing uploaded images at /media/products/image.jpg
 #
 # IMPORTANT: This only works when DEBUG=True (development mode)
-# In production, configure your web server (Nginx, Apache) to serve media files
+# In production, media is served from S3 / the CDN (USE_S3_MEDIA in settings.py)
 #
 # static() function creates URL pattern for media files:
 #   - MEDIA_URL: URL prefix (/media/)
 #   - document_root: Directory where files are stored (MEDIA_ROOT)
-urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+if settings.DEBUG and not settings.USE_S3_MEDIA:
+    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
 
 # Note: Static files (CSS, JS) are automatically served by Django during development
 # No need to add anything here for static files
@@ -17,7 +17,12 @@ application = get_wsgi_application()
 
 app = application  # For compatibility with some WSGI servers
 
-# On Vercel, /tmp/ is ephemeral — run migrations on cold start to create tables
+# On Vercel, run migrations on cold start:
+# - Without Postgres the SQLite database lives in /tmp/, which is empty on
+#   every cold start, so the tables have to be created
+# - With Postgres (POSTGRES_HOST) this applies a new deploy's migrations;
+#   vercel.json only builds this file, so build_files.sh never runs there.
+#   When nothing is pending this is just a read of django_migrations.
 if os.environ.get('VERCEL'):
     from django.core.management import call_command
     import django
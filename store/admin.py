@@ -11,7 +11,16 @@ Django Admin:
 Purpose:
 - Register models so they appear in admin panel
 - Allows staff to add/edit/delete products, categories, etc.
-- Can be customized with ModelAdmin classes for advanced features
+- ModelAdmin classes keep the list pages fast as the tables grow
+
+ModelAdmin Options Used:
+- list_display: Columns on the list page (only plain columns or joined
+  foreign keys - never many-to-many fields, which need a query per row)
+- list_select_related: JOIN the foreign keys shown in list_display, so
+  the list page runs one query instead of one per row
+- list_per_page: Rows per list page
+- raw_id_fields: Show an ID box instead of a <select> with every row
+  of the related table (e.g. all users or all products)
 """
 
 from django.contrib import admin
@@ -21,26 +30,60 @@ from .models import Category, Product, Tag, Cart, CartProduct
 # REGISTER MODELS FOR ADMIN INTERFACE
 # ============================================================
 
-# Register Category model - manage product categories
-admin.site.register(Category)
 
-# Register Product model - manage all products
+# Category model - manage product categories
+@admin.register(Category)
+class CategoryAdmin(admin.ModelAdmin):
+    list_display = ("name",)
+    search_fields = ("name",)
+
+
+# Tag model - manage product tags
+@admin.register(Tag)
+class TagAdmin(admin.ModelAdmin):
+    list_display = ("name",)
+    search_fields = ("name",)
+
+
+# Product model - manage all products
 # This is the main model where you add/edit products
-admin.site.register(Product)
+@admin.register(Product)
+class ProductAdmin(admin.ModelAdmin):
+    list_display = (
+        "name",
+        "price",
+        "old_price",
+        "featured",
+        "new_arrivals",
+        "top_selling",
+        "all_products",
+        "created_at",
+    )
+    list_filter = ("featured", "new_arrivals", "top_selling", "all_products")
+    search_fields = ("name",)
+    list_per_page = 50
+    # Two-box picker instead of a long multi-select
+    filter_horizontal = ("category", "tag")
+
 
-# Register Tag model - manage product tags
-admin.site.register(Tag)
+# Cart model - view/manage user shopping carts
+@admin.register(Cart)
+class CartAdmin(admin.ModelAdmin):
+    list_display = ("id", "user")
+    list_select_related = ("user",)  # str(cart) shows the user's email
+    search_fields = ("user__email",)
+    list_per_page = 50
+    raw_id_fields = ("user",)
 
-# Register Cart model - view/manage user shopping carts
-admin.site.register(Cart)
 
-# Register CartProduct model - view/manage items in carts
+# CartProduct model - view/manage items in carts
 # Shows the relationship between carts and products with quantities
-admin.site.register(CartProduct)
-
-# Note: For more advanced admin features, you can create ModelAdmin classes:
-# class ProductAdmin(admin.ModelAdmin):
-#     list_display = ['name', 'price', 'created_at']
-#     list_filter = ['category', 'featured']
-#     search_fields = ['name', 'description']
-# admin.site.register(Product, ProductAdmin)
+@admin.register(CartProduct)
+class CartProductAdmin(admin.ModelAdmin):
+    list_display = ("id", "product", "cart", "quantity", "added_at")
+    # product, cart and the cart's user are all shown on every row
+    list_select_related = ("product", "cart", "cart__user")
+    list_filter = ("added_at",)
+    search_fields = ("product__name", "cart__user__email")
+    list_per_page = 50
+    raw_id_fields = ("product", "cart")
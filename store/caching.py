@@ -0,0 +1,164 @@
+"""
+Store Caching Helpers
+=====================
+This file keeps the cache keys and cached lookups used by the store app.
+
+Why a Separate File?
+- Views, forms and signal handlers all need the same cache keys
+- Keeping them in one place means a key can't be read under one name
+  and cleared under another
+
+Key Concepts:
+- cache.get_or_set(): Return the cached value, or compute and store it
+- cache_for_anonymous: Serve a whole rendered page from the cache to
+  visitors who aren't logged in
+- Invalidation: store/signals.py deletes these keys when the data changes,
+  so the timeouts below are only a safety net
+"""
+
+from functools import wraps
+
+from django.contrib.messages.storage.cookie import CookieStorage
+from django.core.cache import cache
+from django.core.cache.utils import make_template_fragment_key
+from django.http import HttpResponse
+
+from .models import Category
+
+
+# ============================================================
+# CATEGORY CHOICES
+# ============================================================
+# Cache key for the category checkboxes on the shop page
+# Bump the version suffix if the cached value's format ever changes
+CATEGORY_CHOICES_CACHE_KEY = "store:categories:v1"
+
+# How long (seconds) to keep the cached categories
+CATEGORY_CHOICES_CACHE_TIMEOUT = 60 * 5
+
+
+def get_category_choices():
+    """
+    Return all categories as a list of (id, name) tuples.
+
+    Purpose:
+        - Used as the choices of FilterProductForm's category checkboxes
+        - Categories rarely change, so they are read from the database
+          at most once per timeout instead of on every shop page load
+
+    Returns:
+        - List like [(1, "Laptops"), (2, "Phones"), ...]
+    """
+    return cache.get_or_set(
+        CATEGORY_CHOICES_CACHE_KEY,
+        lambda: list(Category.objects.values_list("id", "name")),
+        CATEGORY_CHOICES_CACHE_TIMEOUT,
+    )
+
+
+def clear_category_choices():
+    """Forget the cached categories (called when a category changes)."""
+    cache.delete(CATEGORY_CHOICES_CACHE_KEY)
+
+
+# ============================================================
+# ANONYMOUS PAGE CACHE
+# ============================================================
+# Cache key for the rendered homepage shown to visitors who aren't logged in
+HOME_PAGE_CACHE_KEY = "store:home:anon"
+
+# How long (seconds) to keep the rendered homepage
+HOME_PAGE_CACHE_TIMEOUT = 60 * 5
+
+
+def cache_for_anonymous(key, timeout):
+    """
+    Decorator that caches a view's rendered HTML for anonymous visitors.
+
+    Parameters:
+        - key: Cache key for the rendered page
+        - timeout: How long (seconds) to keep it
+
+    Why Not cache_page?
+        - cache_page + vary_on_cookie stores one copy per session cookie,
+          so almost every visitor gets their own (useless) entry
+        - Here all anonymous visitors share ONE entry, and logged-in users
+          (who see their email and "Added" cart buttons) always get a
+          freshly rendered page
+
+    The cache is skipped when the page could differ between visitors:
+        - User is logged in
+        - Request has GET parameters (e.g. ?search=... shown in the header)
+        - A flash message is waiting to be shown (base.html displays it)
+        - Request isn't GET/HEAD, or the response isn't a plain 200
+          (or it sets cookies)
+    """
+
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            cacheable = (
+                request.method in ("GET", "HEAD")
+                and not request.GET
+                and not request.COOKIES.get(CookieStorage.cookie_name)
+                and not request.user.is_authenticated
+            )
+            if not cacheable:
+                return view_func(request, *args, **kwargs)
+
+            content = cache.get(key)
+            if content is not None:
+                return HttpResponse(content)
+
+            response = view_func(request, *args, **kwargs)
+            if (
+                response.status_code == 200
+                and not response.streaming
+                and not response.cookies
+            ):
+                cache.set(key, response.content, timeout)
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+# ============================================================
+# HOMEPAGE SECTIONS
+# ============================================================
+# Cache key for the homepage's product sections ({flag: [products]}), shared
+# by every visitor; logged-in users skip the page cache but not this one
+HOME_SECTIONS_CACHE_KEY = "store:home:sections:v1"
+
+# How long (seconds) to keep the cached sections
+HOME_SECTIONS_CACHE_TIMEOUT = 60 * 5
+
+
+# ============================================================
+# HOMEPAGE FRAGMENTS
+# ============================================================
+# Names of the {% cache %} blocks around the product grids in home.html
+# Each is cached twice: for logged-in users and for anonymous visitors
+# (vary_on request.user.is_authenticated, which decides the cart button)
+HOME_FRAGMENT_NAMES = (
+    "home_new_arrivals",
+    "home_featured",
+    "home_top_selling",
+    "home_all_products",
+)
+
+
+def clear_home_page():
+    """
+    Forget the cached homepage, its product sections and its product grid
+    fragments (called when a product changes).
+    """
+    cache.delete_many(
+        [HOME_PAGE_CACHE_KEY, HOME_SECTIONS_CACHE_KEY]
+        + [
+            make_template_fragment_key(name, [is_authenticated])
+            for name in HOME_FRAGMENT_NAMES
+            for is_authenticated in (True, False)
+        ]
+    )
@@ -0,0 +1,77 @@
+"""
+Store Context Processors
+========================
+This file adds store data to the context of every template.
+
+Context Processors in Django:
+- Functions that take the request and return a dict of template variables
+- Listed in TEMPLATES["OPTIONS"]["context_processors"] (project/settings.py)
+- Run for every template rendered with a request (render(request, ...))
+"""
+
+from django.utils.functional import SimpleLazyObject
+
+from .models import CartProduct
+
+
+# ============================================================
+# HELPER FUNCTION
+# ============================================================
+def get_cart_product_ids(request):
+    """
+    Helper function to get list of product IDs currently in user's cart.
+
+    Purpose:
+        - Used to highlight "Added to Cart" products in product listings
+        - Shows which products are already in the cart
+
+    Parameters:
+        - request: HTTP request object containing user information
+
+    Returns:
+        - frozenset of product IDs (integers) that are in the user's cart
+          (a set, so {% if product.id in cart_product_ids %} is a hash
+          lookup instead of a scan through the whole cart per product)
+        - Empty frozenset if user is not logged in or has no cart
+
+    Logic Flow:
+        1. Check if user is authenticated (logged in)
+        2. If not logged in, return an empty set
+        3. Get product IDs of all CartProduct rows whose cart belongs to
+           this user (one query - the cart is joined, not fetched first)
+        4. Remember the result on the request, so calling this again
+           during the same request doesn't query the database again
+    """
+    if not request.user.is_authenticated:
+        return frozenset()
+
+    if not hasattr(request, "_cart_product_ids"):
+        # cart__user: follow the cart foreign key to filter by its user
+        # flat=True returns plain IDs instead of tuples
+        request._cart_product_ids = frozenset(
+            CartProduct.objects.filter(cart__user=request.user).values_list(
+                "product_id", flat=True
+            )
+        )
+    return request._cart_product_ids
+
+
+# ============================================================
+# CART CONTEXT PROCESSOR
+# ============================================================
+def cart(request):
+    """
+    Make cart_product_ids available in every template.
+
+    Template variable:
+        - cart_product_ids: Product IDs in the user's cart, e.g.
+          {% if product.id in cart_product_ids %}Added{% endif %}
+
+    Note:
+        - Lazy: the query only runs if a template actually uses the
+          variable, so pages without product cards (login, contact, ...)
+          and cached page fragments cost nothing
+    """
+    return {
+        "cart_product_ids": SimpleLazyObject(lambda: get_cart_product_ids(request)),
+    }
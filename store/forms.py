@@ -10,7 +10,12 @@ Forms in Django:
 - Display errors to users
 """
 
+from dataclasses import dataclass
+from decimal import Decimal
+
 from django import forms
+from django.db.models import QuerySet
+from .caching import get_category_choices
 from .models import Product, Category
 
 
@@ -28,6 +33,43 @@ SORTING_CHOICES = [
 ]
 
 
+# ============================================================
+# SHOP FILTERS
+# ============================================================
+@dataclass(frozen=True, slots=True)
+class ShopFilters:
+    """
+    Validated shop page filters (see FilterProductForm.get_filters).
+
+    One typed object instead of reading cleaned_data key by key; frozen
+    (read-only) and slots (no per-object __dict__), so it is small and
+    can't be changed by accident while the listing is built.
+
+    Fields:
+        - name: Product name search, "" if not searched
+        - categories: Selected Category queryset (empty if none)
+        - min_price / max_price: Price limits, None if not set
+        - sorting_key: One of SORTING_CHOICES, "" for the default order
+    """
+
+    name: str
+    categories: QuerySet
+    min_price: Decimal | None
+    max_price: Decimal | None
+    sorting_key: str
+
+    @property
+    def applied(self):
+        """True if the user chose any filter (or a sort order)."""
+        return bool(
+            self.name
+            or self.categories
+            or self.min_price
+            or self.max_price
+            or self.sorting_key
+        )
+
+
 # ============================================================
 # PRODUCT FILTER FORM
 # ============================================================
@@ -95,7 +137,8 @@ class FilterProductForm(forms.Form):
 
     # ========== CATEGORY FILTER ==========
     # ModelMultipleChoiceField: Select multiple categories from database
-    # queryset: All categories from database to choose from
+    # queryset: Used to validate the selected categories
+    # The checkbox choices are set from the cache in __init__ (see below)
     # widget=CheckboxSelectMultiple: Show as checkboxes instead of dropdown
     categories = forms.ModelMultipleChoiceField(
         queryset=Category.objects.all(),  # Get all categories from database
@@ -116,3 +159,27 @@ class FilterProductForm(forms.Form):
             }
         ),
     )
+
+    def __init__(self, *args, **kwargs):
+        """
+        Set the category checkboxes from the cached category list.
+
+        Without this, rendering the checkboxes runs SELECT on the category
+        table for every shop page load. The cached (id, name) list is
+        cleared by store/signals.py whenever a category changes.
+
+        Note:
+            - The queryset is still used to validate submitted categories,
+              so a query only runs when the user actually filters by one
+        """
+        super().__init__(*args, **kwargs)
+        self.fields["categories"].choices = get_category_choices()
+
+    def get_filters(self):
+        """
+        Return the validated filters as a ShopFilters object.
+
+        Note:
+            - Only call after is_valid() returned True
+        """
+        return ShopFilters(**self.cleaned_data)
@@ -0,0 +1,82 @@
+"""
+Store Image Variants
+====================
+This file configures the resized product image variants (django-imagekit).
+
+Why Variants?
+- Product cards are at most a few hundred pixels wide, but used to load the
+  full-size uploaded image
+- WebP/AVIF at 320/640/1280 px are a fraction of the original's size; the
+  <picture> partial (store/includes/product_picture.html) lets the browser
+  choose the smallest one that fits
+
+Key Concepts:
+- ImageSpecField: A resized copy of another image field (not a DB column)
+- Cache file strategy: Decides WHEN a variant is generated (on save)
+"""
+
+import logging
+
+from imagekit.models import ImageSpecField
+from imagekit.processors import ResizeToFit
+
+logger = logging.getLogger(__name__)
+
+# Encoder quality per format (AVIF looks as good as WebP at a lower value)
+VARIANT_QUALITY = {"WEBP": 80, "AVIF": 60}
+
+
+def product_image_variant(size, image_format):
+    """
+    Build an ImageSpecField that resizes Product.image to fit size x size.
+
+    Parameters:
+        - size: Maximum width and height in pixels
+        - image_format: "WEBP" or "AVIF"
+
+    Note:
+        - upscale=False: Small originals are never enlarged
+    """
+    return ImageSpecField(
+        source="image",
+        processors=[ResizeToFit(size, size, upscale=False)],
+        format=image_format,
+        options={"quality": VARIANT_QUALITY[image_format]},
+    )
+
+
+# ============================================================
+# CACHE FILE STRATEGY
+# ============================================================
+class GenerateOnSave:
+    """
+    Generate the variants when a product image is saved, never while a
+    page is rendering.
+
+    Why?
+        - Encoding six WebP/AVIF files from a large upload takes seconds;
+          doing it the first time a page needs them (imagekit's default
+          JustInTime) made the first shop render after adding products
+          take longer than a serverless request may run
+        - Saving the image (admin upload) already takes a moment, so the
+          encode is done there instead: synchronously by default, or
+          queued on the Celery worker when one is configured
+        - Images that existed before variants were added are generated
+          with "python manage.py generateimages" (build_files.sh)
+
+    Existence check:
+        - Templates ask whether a variant exists before using its URL
+          (store/includes/product_picture.html) and fall back to the
+          original image when it doesn't (e.g. still queued on the worker)
+        - imagekit caches the answer, so most checks don't touch storage
+    """
+
+    def on_source_saved(self, file):
+        try:
+            file.generate()
+        except FileNotFoundError:
+            # Don't fail the product save; the page shows the original
+            logger.warning("Source image missing for %s", file.name)
+
+    def should_verify_existence(self, file):
+        return True
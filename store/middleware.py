@@ -0,0 +1,63 @@
+"""
+Store Middleware
+================
+This file contains middleware used by the store app.
+
+Middleware in Django:
+- Runs for every request before the view, and for every response after it
+- Registered in MIDDLEWARE (project/settings.py); order matters
+"""
+
+import re
+
+from django.conf import settings
+
+# Hex run of 12+ characters right before the extension, e.g.
+#   products/phone.3f2a1b9c8d7e.jpg        (ContentHashedImageField)
+#   CACHE/images/products/phone/4bd73...f4.webp  (imagekit variants)
+HASHED_NAME_RE = re.compile(r"[./][0-9a-f]{12,}\.\w+$")
+
+# Hashed files never change under the same URL: cache for a year
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Other media (uploaded before hashed names): cache for a day, then keep
+# serving the cached copy for up to a week while it is re-checked
+REVALIDATE_CACHE_CONTROL = "public, max-age=86400, stale-while-revalidate=604800"
+
+
+# ============================================================
+# MEDIA CACHE HEADERS
+# ============================================================
+class MediaCacheHeadersMiddleware:
+    """
+    Add Cache-Control headers to media files (product images).
+
+    Purpose:
+        - Django's static() media view sends no Cache-Control header, so
+          browsers re-requested every product image on every visit
+        - Hashed file names get a 1-year "immutable" lifetime, everything
+          else a 1 day lifetime with stale-while-revalidate
+
+    Note:
+        - Only affects media served by Django itself (MEDIA_URL starting
+          with "/"); with S3 the headers are set on upload instead
+          (AWS_S3_OBJECT_PARAMETERS in settings.py)
+        - Responses that already set Cache-Control are left alone
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+
+        if (
+            request.path.startswith(settings.MEDIA_URL)
+            and response.status_code in (200, 304)
+            and not response.has_header("Cache-Control")
+        ):
+            if HASHED_NAME_RE.search(request.path):
+                response["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+            else:
+                response["Cache-Control"] = REVALIDATE_CACHE_CONTROL
+        return response
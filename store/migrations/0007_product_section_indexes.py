@@ -0,0 +1,29 @@
+# Generated by Django 6.0.1 on 2026-10-14 19:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('store', '0006_alter_cartproduct_product'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['featured', '-created_at'], name='product_featured_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['new_arrivals', '-created_at'], name='product_new_arr_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['top_selling', '-created_at'], name='product_top_sell_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['all_products', '-created_at'], name='product_all_created_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 6.0.1 on 2026-10-14 19:40
+
+import store.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('store', '0007_product_section_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='product',
+            name='image',
+            field=models.ImageField(upload_to=store.models.product_image_upload_to),
+        ),
+    ]
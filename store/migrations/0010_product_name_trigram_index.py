@@ -0,0 +1,45 @@
+# Generated by Django 6.0.1 on 2026-10-14 20:30
+
+from django.db import migrations
+
+# Product name search (shop page) uses name__icontains, which PostgreSQL
+# runs as:  UPPER("store_product"."name"::text) LIKE UPPER('%phone%')
+# A normal (B-tree) index can't help with a leading %, so every search
+# read the whole table. A trigram (pg_trgm) GIN index on exactly that
+# UPPER(...) expression lets PostgreSQL find the matching rows directly.
+#
+# PostgreSQL only: SQLite (local development) has no pg_trgm, so there
+# this migration does nothing.
+CREATE_TRIGRAM_INDEX = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    'CREATE INDEX IF NOT EXISTS product_name_trgm ON store_product '
+    'USING gin ((UPPER("name"::text)) gin_trgm_ops)',
+]
+DROP_TRIGRAM_INDEX = [
+    # The extension is left installed: other tables may use it
+    "DROP INDEX IF EXISTS product_name_trgm",
+]
+
+
+def run_on_postgresql(statements):
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor != "postgresql":
+            return
+        for sql in statements:
+            schema_editor.execute(sql)
+
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('store', '0009_product_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            run_on_postgresql(CREATE_TRIGRAM_INDEX),
+            run_on_postgresql(DROP_TRIGRAM_INDEX),
+        ),
+    ]
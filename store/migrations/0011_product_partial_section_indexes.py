@@ -0,0 +1,45 @@
+# Generated by Django 6.0.1 on 2026-10-14 21:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('store', '0010_product_name_trigram_index'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='product',
+            name='product_featured_created_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='product',
+            name='product_new_arr_created_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='product',
+            name='product_top_sell_created_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='product',
+            name='product_all_created_idx',
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(condition=models.Q(('featured', True)), fields=['-created_at'], name='product_featured_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(condition=models.Q(('new_arrivals', True)), fields=['-created_at'], name='product_new_arr_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(condition=models.Q(('top_selling', True)), fields=['-created_at'], name='product_top_sell_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(condition=models.Q(('all_products', True)), fields=['-created_at'], name='product_all_created_idx'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 6.0.1 on 2026-10-14 21:35
+
+from django.conf import settings
+from django.db import migrations
+
+
+def create_missing_carts(apps, schema_editor):
+    """Give every existing user without a cart an empty one."""
+    User = apps.get_model(settings.AUTH_USER_MODEL)
+    Cart = apps.get_model("store", "Cart")
+    users_without_cart = User.objects.filter(cart__isnull=True).values_list("pk", flat=True)
+    Cart.objects.bulk_create(
+        [Cart(user_id=user_id) for user_id in users_without_cart],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('store', '0011_product_partial_section_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # Reversing leaves the carts in place (they are still valid)
+        migrations.RunPython(create_missing_carts, migrations.RunPython.noop),
+    ]
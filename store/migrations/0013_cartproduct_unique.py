@@ -0,0 +1,44 @@
+# Generated by Django 6.0.1 on 2026-10-14 22:05
+
+from django.db import migrations, models
+from django.db.models import Count, Min, Sum
+
+# Same limit as store.models.MAX_CART_QUANTITY (copied: migrations must not
+# change when the model code does)
+MAX_CART_QUANTITY = 99
+
+
+def merge_duplicate_cart_items(apps, schema_editor):
+    """
+    Merge rows for the same product in the same cart into one (keeping the
+    oldest row, with the quantities added up), so the unique constraint
+    below can be created.
+    """
+    CartProduct = apps.get_model("store", "CartProduct")
+    duplicates = (
+        CartProduct.objects.values("cart_id", "product_id")
+        .annotate(rows=Count("id"), keep_id=Min("id"), total=Sum("quantity"))
+        .filter(rows__gt=1)
+    )
+    for group in duplicates:
+        CartProduct.objects.filter(pk=group["keep_id"]).update(
+            quantity=min(group["total"], MAX_CART_QUANTITY)
+        )
+        CartProduct.objects.filter(
+            cart_id=group["cart_id"], product_id=group["product_id"]
+        ).exclude(pk=group["keep_id"]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('store', '0012_create_missing_carts'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_cart_items, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='cartproduct',
+            constraint=models.UniqueConstraint(fields=('cart', 'product'), name='uniq_cartproduct'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 6.0.1 on 2026-10-14 23:37
+
+import store.models
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('store', '0013_cartproduct_unique'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='product',
+            name='image',
+            field=store.models.ContentHashedImageField(upload_to=store.models.product_image_upload_to),
+        ),
+    ]
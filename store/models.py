@@ -5,7 +5,16 @@ This file defines all database models for the e-commerce store.
 Models represent database tables and their relationships.
 """
 
-from django.db import models
+import hashlib
+import os
+
+from django.db import connections, models, router
+from django.db.models import F, Q
+from django.db.models.fields.files import ImageFieldFile
+from django.db.models.functions import Least
+from django.utils import timezone
+
+from .images import product_image_variant
 
 
 # ============================================================
@@ -60,6 +69,51 @@ class Tag(models.Model):
 # ============================================================
 # PRODUCT MODEL
 # ============================================================
+def product_image_upload_to(instance, filename):
+    """
+    Build the storage path for an uploaded product image.
+
+    The filename already contains the content hash (added by
+    ContentHashedImageFieldFile.save), so this only picks the folder:
+        Upload: "phone.jpg"
+        Stored as: "products/phone.3f2a1b9c8d7e.jpg"
+    """
+    return f"products/{filename}"
+
+
+class ContentHashedImageFieldFile(ImageFieldFile):
+    """
+    Image file whose stored name includes a hash of its content.
+
+    The first 12 hex digits of the new file's SHA-1 are added to the name
+    before it is saved: "phone.jpg" -> "phone.3f2a1b9c8d7e.jpg"
+
+    Why?
+        - Replacing a product's image gives it a new URL, so the old URL's
+          content never changes and browsers/CDNs can cache it "forever"
+          (see store/middleware.py and AWS_S3_OBJECT_PARAMETERS)
+
+    Note:
+        - The hash is taken from the content being saved, not from the file
+          currently on the instance, so it is right for admin uploads,
+          image.save(name, content) on new products, and replacements
+    """
+
+    def save(self, name, content, save=True):
+        digest = hashlib.sha1(usedforsecurity=False)
+        for chunk in content.chunks():
+            digest.update(chunk)
+        stem, ext = os.path.splitext(os.path.basename(name))
+        name = f"{stem}.{digest.hexdigest()[:12]}{ext.lower()}"
+        super().save(name, content, save)
+
+
+class ContentHashedImageField(models.ImageField):
+    """ImageField that stores files under content-hashed names."""
+
+    attr_class = ContentHashedImageFieldFile
+
+
 class Product(models.Model):
     """
     Product Model - Main model for storing product information
@@ -68,7 +122,8 @@ class Product(models.Model):
         - name: Product name (max 50 characters)
         - old_price: Original price before discount (15 digits, 2 decimals)
         - price: Current selling price (15 digits, 2 decimals)
-        - image: Product image file (stored in media/products/)
+        - image: Product image file (stored in media/products/, the file
+                 name includes a hash of its content)
         - description: Detailed product description (unlimited text)
         - all_products: Boolean flag to show in "All Products" section
         - featured: Boolean flag to show in "Featured Products" section
@@ -79,6 +134,14 @@ class Product(models.Model):
         - created_at: Timestamp when product was created (auto-set)
         - updated_at: Timestamp when product was last updated (auto-updated)
 
+    Image Variants (not database columns):
+        - image_webp_320/640/1280: WebP copies resized to fit 320/640/1280 px
+        - image_avif_320/640/1280: AVIF copies of the same sizes
+        - Generated by django-imagekit from "image" and stored under
+          media/CACHE/; templates offer them via <picture> + srcset
+          (store/includes/product_picture.html) so browsers download the
+          smallest suitable file instead of the full-size original
+
     Usage:
         Central model for all product data in the e-commerce store.
         Products can belong to multiple categories and have multiple tags.
@@ -87,7 +150,17 @@ class Product(models.Model):
     name = models.CharField(max_length=50)
     old_price = models.DecimalField(max_digits=15, decimal_places=2, default=0.0)
     price = models.DecimalField(max_digits=15, decimal_places=2, default=0.0)
-    image = models.ImageField(upload_to="products/")  # Uploads to MEDIA_ROOT/products/
+    # Uploads to MEDIA_ROOT/products/ with a content hash in the name
+    image = ContentHashedImageField(upload_to=product_image_upload_to)
+
+    # Resized WebP / AVIF variants of "image" (see docstring above)
+    image_webp_320 = product_image_variant(320, "WEBP")
+    image_webp_640 = product_image_variant(640, "WEBP")
+    image_webp_1280 = product_image_variant(1280, "WEBP")
+    image_avif_320 = product_image_variant(320, "AVIF")
+    image_avif_640 = product_image_variant(640, "AVIF")
+    image_avif_1280 = product_image_variant(1280, "AVIF")
+
     description = models.TextField()  # No character limit
 
     # Boolean flags for product sections on the website
@@ -105,6 +178,44 @@ class Product(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)  # Set once when created
     updated_at = models.DateTimeField(auto_now=True)  # Updated every time saved
 
+    class Meta:
+        # Indexes for the section queries, e.g. top_selling=True newest first
+        # (bestseller page). Each index is sorted by newest, so the database
+        # reads the matching rows already in order instead of scanning and
+        # sorting the whole table.
+        # Partial indexes (condition=): only products WITH the flag are in
+        # the index - pages never ask for e.g. top_selling=False, so those
+        # rows would only make the index bigger.
+        indexes = [
+            models.Index(
+                fields=["-created_at"],
+                name="product_featured_created_idx",
+                condition=Q(featured=True),
+            ),
+            models.Index(
+                fields=["-created_at"],
+                name="product_new_arr_created_idx",
+                condition=Q(new_arrivals=True),
+            ),
+            models.Index(
+                fields=["-created_at"],
+                name="product_top_sell_created_idx",
+                condition=Q(top_selling=True),
+            ),
+            models.Index(
+                fields=["-created_at"],
+                name="product_all_created_idx",
+                condition=Q(all_products=True),
+            ),
+            # Keyset pagination on the shop page (see SHOP_SORT_KEYS in
+            # views.py): each page starts with an index seek to the last
+            # product of the previous page. The id is the tie-breaker for
+            # products with the same date or price. Reverse sort orders
+            # (oldest, price high to low) read the same index backwards.
+            models.Index(fields=["-created_at", "-id"], name="product_created_id_idx"),
+            models.Index(fields=["price", "id"], name="product_price_id_idx"),
+        ]
+
     def __str__(self):
         """String representation shown in admin panel and queries"""
         return self.name
@@ -143,6 +254,103 @@ class Cart(models.Model):
 # ============================================================
 # CARTPRODUCT MODEL (INTERMEDIATE TABLE)
 # ============================================================
+# Most units of one product a cart can hold
+MAX_CART_QUANTITY = 99
+
+
+class CartProductManager(models.Manager):
+    """
+    Manager for CartProduct with a single-statement "add to cart".
+
+    Methods:
+        - add_product(): Insert a cart row, or add to its quantity
+    """
+
+    # SQL function returning the smaller of two values, per database
+    LEAST_FUNCTION = {"postgresql": "LEAST", "sqlite": "MIN"}
+
+    def add_product(self, user_id, product_id, quantity):
+        """
+        Put quantity units of a product in a user's cart.
+
+        Parameters:
+            - user_id: Owner of the cart
+            - product_id: Product to add
+            - quantity: Units to add (1 to MAX_CART_QUANTITY)
+
+        Returns:
+            - (new quantity, created) tuple: the item's quantity (capped at
+              MAX_CART_QUANTITY), and whether the product was new in the
+              cart (False if it was already there and got more units)
+            - None if the user has no cart yet (nothing was added)
+
+        How?
+            - One INSERT ... ON CONFLICT (cart_id, product_id) DO UPDATE
+              statement (an "upsert"): a new product gets a row, a product
+              already in the cart gets its quantity increased
+            - The cart id is looked up inside the same statement
+              (INSERT ... SELECT), so an add is a single round-trip, and it
+              is atomic: two quick clicks both count, with no
+              SELECT-then-INSERT race
+            - RETURNING sends back the row's quantity, and whether its
+              added_at is the value just inserted (the update keeps the
+              old one), i.e. whether the row is new
+            - Relies on the uniq_cartproduct constraint (see Meta)
+
+        Database support:
+            - PostgreSQL 9.5+, and SQLite 3.35+ (RETURNING; SQLite also
+              needs the WHERE clause after INSERT ... SELECT so that
+              ON CONFLICT isn't parsed as part of the SELECT's join)
+            - Checked with Django's feature flags, so other databases and
+              older SQLite builds fall back to get_or_create + an F() update
+        """
+        connection = connections[self._db or router.db_for_write(self.model)]
+        least = self.LEAST_FUNCTION.get(connection.vendor)
+        features = connection.features
+        if (
+            least is None
+            or not features.supports_update_conflicts_with_target
+            or not features.can_return_columns_from_insert
+        ):
+            return self._add_product_fallback(connection.alias, user_id, product_id, quantity)
+
+        table = connection.ops.quote_name(self.model._meta.db_table)
+        cart_table = connection.ops.quote_name(Cart._meta.db_table)
+        added_at = connection.ops.adapt_datetimefield_value(timezone.now())
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                INSERT INTO {table} (cart_id, product_id, quantity, added_at)
+                SELECT id, %s, %s, %s FROM {cart_table} WHERE user_id = %s
+                ON CONFLICT (cart_id, product_id) DO UPDATE
+                SET quantity = {least}({table}.quantity + excluded.quantity, %s)
+                RETURNING quantity, added_at = %s
+                """,
+                [product_id, quantity, added_at, user_id, MAX_CART_QUANTITY, added_at],
+            )
+            row = cursor.fetchone()
+        if row is None:
+            return None
+        new_quantity, created = row
+        return new_quantity, bool(created)
+
+    def _add_product_fallback(self, using, user_id, product_id, quantity):
+        """add_product() for databases without ON CONFLICT (two statements)."""
+        cart = Cart.objects.using(using).filter(user_id=user_id).first()
+        if cart is None:
+            return None
+        item, created = self.using(using).get_or_create(
+            cart=cart, product_id=product_id, defaults={"quantity": quantity}
+        )
+        if created:
+            return item.quantity, True
+        self.using(using).filter(pk=item.pk).update(
+            quantity=Least(F("quantity") + quantity, MAX_CART_QUANTITY)
+        )
+        item.refresh_from_db(fields=["quantity"])
+        return item.quantity, False
+
+
 class CartProduct(models.Model):
     """
     CartProduct Model - Links products to carts with quantity
@@ -185,6 +393,15 @@ class CartProduct(models.Model):
     quantity = models.PositiveIntegerField(default=1)  # Must be 1 or greater
     added_at = models.DateTimeField(auto_now_add=True)  # Set once when added
 
+    objects = CartProductManager()
+
+    class Meta:
+        # A product appears at most once per cart (its quantity goes up
+        # instead); also what add_product()'s ON CONFLICT targets
+        constraints = [
+            models.UniqueConstraint(fields=["cart", "product"], name="uniq_cartproduct"),
+        ]
+
     # to get sub total price
     @property
     def get_total_price(self):
@@ -0,0 +1,64 @@
+"""
+Store Signals
+=============
+This file contains signal handlers that keep the store's caches fresh,
+and give every new user an (empty) shopping cart.
+
+Django Signals:
+- post_save: Sent after a model instance is saved (created or updated)
+- post_delete: Sent after a model instance is deleted
+- Handlers are connected in StoreConfig.ready() (store/apps.py)
+"""
+
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .caching import clear_category_choices, clear_home_page
+from .models import Cart, Category, Product
+
+
+# ============================================================
+# CATEGORY CACHE INVALIDATION
+# ============================================================
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def category_changed(sender, **kwargs):
+    """
+    Clear the cached category choices when a category is added,
+    renamed or deleted (e.g. in the admin panel).
+    """
+    clear_category_choices()
+
+
+# ============================================================
+# HOMEPAGE CACHE INVALIDATION
+# ============================================================
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+def product_changed(sender, **kwargs):
+    """
+    Clear the cached homepage (page, sections and product grids) when a
+    product is added, edited or deleted, so price and section changes
+    show up straight away.
+    """
+    clear_home_page()
+
+
+# ============================================================
+# CART ON SIGNUP
+# ============================================================
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def user_created(sender, instance, created, raw=False, **kwargs):
+    """
+    Create the user's cart when they sign up.
+
+    Why?
+        - Saves the cart views an INSERT attempt on a user's first
+          "Add to cart"; the cart always exists, so get_or_create only
+          runs its SELECT
+        - raw: Skip while loading fixtures (loaddata), which brings its
+          own carts
+    """
+    if created and not raw:
+        Cart.objects.get_or_create(user=instance)
@@ -1,3 +1,487 @@
-from django.test import TestCase
+import base64
+import hashlib
+import io
+import shutil
+import tempfile
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.messages.storage.cookie import CookieStorage
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.db import connection
+from django.db.models import QuerySet
+from django.template.loader import render_to_string
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from PIL import Image
+
+from accounts.models import CustomUser
+
+from .caching import HOME_PAGE_CACHE_KEY
+from .models import MAX_CART_QUANTITY, Cart, CartProduct, Product
+from .views import SHOP_PAGE_SIZE, SHOP_SORT_KEYS, _decode_cursor, _encode_cursor
+
+
+def make_jpeg(color="red", size=(64, 64)):
+    """Bytes of a small JPEG image."""
+    buffer = io.BytesIO()
+    Image.new("RGB", size, color).save(buffer, "JPEG")
+    return buffer.getvalue()
+
+
+class MediaTestCase(TestCase):
+    """TestCase that stores uploaded media in a temporary directory."""
+
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        media_override = override_settings(MEDIA_ROOT=media_root)
+        media_override.enable()
+        self.addCleanup(media_override.disable)
+        # imagekit caches whether a variant exists
+        cache.clear()
+
+
+def content_hash(data):
+    """The 12 hex digits product image names carry for data."""
+    return hashlib.sha1(data, usedforsecurity=False).hexdigest()[:12]
+
+
+class ProductImageNameTests(MediaTestCase):
+    def test_upload_on_create(self):
+        data = make_jpeg()
+        product = Product.objects.create(
+            name="Phone", description="", image=ContentFile(data, name="Phone.JPG")
+        )
+
+        self.assertEqual(product.image.name, f"products/Phone.{content_hash(data)}.jpg")
+
+    def test_image_save_on_new_product(self):
+        data = make_jpeg()
+        product = Product(name="Phone", description="")
+        product.image.save("new.jpg", ContentFile(data))
+
+        self.assertEqual(product.image.name, f"products/new.{content_hash(data)}.jpg")
+
+    def test_replacing_image_uses_new_content_hash(self):
+        product = Product.objects.create(
+            name="Phone", description="", image=ContentFile(make_jpeg("red"), name="old.jpg")
+        )
+        data = make_jpeg("blue")
+        product.image.save("replace.jpg", ContentFile(data))
+
+        self.assertEqual(product.image.name, f"products/replace.{content_hash(data)}.jpg")
+
+
+class ProductPictureTests(MediaTestCase):
+    def render_picture(self, product):
+        return render_to_string(
+            "store/includes/product_picture.html", {"product": product}
+        )
+
+    def test_variants_generated_when_image_saved(self):
+        product = Product.objects.create(
+            name="Phone", description="", image=ContentFile(make_jpeg(), name="phone.jpg")
+        )
+
+        html = self.render_picture(product)
+
+        self.assertIn('type="image/webp"', html)
+        self.assertIn('type="image/avif"', html)
+        self.assertTrue(product.image_webp_320.storage.exists(product.image_webp_320.name))
+
+    def test_missing_variants_fall_back_to_original(self):
+        product = Product.objects.create(
+            name="Phone", description="", image=ContentFile(make_jpeg(), name="phone.jpg")
+        )
+        for variant in (product.image_webp_320, product.image_avif_320):
+            variant.storage.delete(variant.name)
+        cache.clear()
+
+        html = self.render_picture(product)
+
+        # Rendering doesn't generate the missing variant...
+        self.assertFalse(product.image_webp_320.storage.exists(product.image_webp_320.name))
+        # ...and only offers the original image
+        self.assertNotIn("<source", html)
+        self.assertIn(f'src="{product.image.url}"', html)
+
+
+def encode_raw_cursor(raw):
+    """Cursor for a hand-made "<value>|<id>" string."""
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+class ShopCursorTests(TestCase):
+    def test_round_trip_created_at(self):
+        product = Product(id=42, created_at=datetime(2026, 10, 14, 9, 30, tzinfo=timezone.utc))
+
+        cursor = _encode_cursor(product, "created_at")
+
+        self.assertEqual(_decode_cursor(cursor, "created_at"), (product.created_at, 42))
+
+    def test_round_trip_price(self):
+        product = Product(id=7, price=Decimal("1999.50"))
+
+        cursor = _encode_cursor(product, "price")
+
+        self.assertEqual(_decode_cursor(cursor, "price"), (Decimal("1999.50"), 7))
+
+    def test_invalid_cursors(self):
+        for cursor, sort_field in [
+            ("", "price"),
+            ("not base64!", "price"),
+            (encode_raw_cursor("12.50"), "price"),  # No id
+            (encode_raw_cursor("abc|1"), "price"),
+            (encode_raw_cursor("12.50|x"), "price"),
+            (encode_raw_cursor("NaN|1"), "price"),
+            (encode_raw_cursor("Infinity|1"), "price"),
+            (encode_raw_cursor("-Infinity|1"), "price"),
+            (encode_raw_cursor("12.50|1"), "created_at"),  # Other sort order
+        ]:
+            with self.subTest(cursor=cursor, sort_field=sort_field):
+                self.assertIsNone(_decode_cursor(cursor, sort_field))
+
+    def test_non_finite_price_cursor_shows_first_page(self):
+        response = self.client.get(
+            reverse("store:shoppage"),
+            {"sorting_key": "price_asc", "after": encode_raw_cursor("NaN|1")},
+        )
+
+        self.assertEqual(response.status_code, 200)
+
+
+class ShopPaginationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        # Few distinct prices and dates, so most pages break inside a tie
+        # and the id tie-breaker decides the order
+        products = Product.objects.bulk_create(
+            Product(
+                name=f"Product {n}",
+                price=Decimal(10 + n % 3),
+                description="",
+                image=f"products/p{n}.jpg",
+            )
+            for n in range(SHOP_PAGE_SIZE * 3 + 3)
+        )
+        for n, product in enumerate(products):
+            Product.objects.filter(pk=product.pk).update(
+                created_at=datetime(2026, 1, 1 + n % 4, tzinfo=timezone.utc)
+            )
+
+    def get_page(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        context = response.context
+        return [p.id for p in context["products"]], context["next_url"], context["previous_url"]
+
+    def test_walk_forward_and_back(self):
+        shop_url = reverse("store:shoppage")
+        for sorting_key, ordering in SHOP_SORT_KEYS.items():
+            with self.subTest(sorting_key=sorting_key):
+                expected = list(
+                    Product.objects.order_by(*ordering).values_list("id", flat=True)
+                )
+
+                # Forward from the first page, following the "next" links
+                pages = []
+                url = f"{shop_url}?sorting_key={sorting_key}"
+                while url:
+                    ids, next_url, previous_url = self.get_page(url)
+                    self.assertEqual(previous_url is None, not pages)
+                    pages.append(ids)
+                    last_page_url = url
+                    url = next_url and shop_url + next_url
+                self.assertGreater(len(pages), 2)
+                self.assertEqual([i for page in pages for i in page], expected)
+                self.assertTrue(all(len(page) == SHOP_PAGE_SIZE for page in pages[:-1]))
+
+                # Back from the last page, following the "previous" links
+                back_pages = []
+                url = last_page_url
+                while url:
+                    ids, next_url, previous_url = self.get_page(url)
+                    self.assertEqual(next_url is None, not back_pages)
+                    back_pages.append(ids)
+                    url = previous_url and shop_url + previous_url
+                self.assertEqual(back_pages[::-1], pages)
+
+
+class CartPageTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user("buyer@example.com", "s3cret-pass")
+        cls.phone, cls.case = Product.objects.bulk_create(
+            Product(name=name, price=price, description="", image=f"products/{name}.jpg")
+            for name, price in [("Phone", Decimal("999.99")), ("Case", Decimal("10.05"))]
+        )
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def test_totals(self):
+        cart = self.user.cart
+        CartProduct.objects.create(cart=cart, product=self.phone, quantity=2)
+        CartProduct.objects.create(cart=cart, product=self.case, quantity=3)
+
+        response = self.client.get(reverse("store:cart"))
+
+        self.assertEqual(response.context["subtotal"], Decimal("2030.13"))
+        self.assertEqual(response.context["tax"], Decimal("263.92"))
+        self.assertEqual(response.context["total"], Decimal("2294.05"))
+        self.assertTrue(response.context["cart_items"])
+
+    def test_empty_cart(self):
+        response = self.client.get(reverse("store:cart"))
+
+        self.assertEqual(response.context["subtotal"], Decimal("0.00"))
+        self.assertEqual(response.context["total"], Decimal("0.00"))
+        self.assertFalse(response.context["cart_items"])
+
+
+class AddToCartTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user("buyer@example.com", "s3cret-pass")
+        # bulk_create: no image file, so skip generating its variants
+        (cls.product,) = Product.objects.bulk_create(
+            [Product(name="Phone", price=Decimal("999.99"), description="", image="products/phone.jpg")]
+        )
+
+    def add(self, quantity):
+        return CartProduct.objects.add_product(self.user.pk, self.product.pk, quantity)
+
+    def test_insert(self):
+        self.assertEqual(self.add(2), (2, True))
+        self.assertEqual(CartProduct.objects.get(cart__user=self.user).quantity, 2)
+
+    def test_increment(self):
+        self.add(2)
+
+        self.assertEqual(self.add(3), (5, False))
+        self.assertEqual(CartProduct.objects.filter(cart__user=self.user).count(), 1)
+
+    def test_cap(self):
+        self.add(1)
+
+        self.assertEqual(self.add(MAX_CART_QUANTITY), (MAX_CART_QUANTITY, False))
+
+    def test_no_cart(self):
+        self.user.cart.delete()
+
+        self.assertIsNone(self.add(1))
+        self.assertFalse(CartProduct.objects.exists())
+
+    def test_view_messages(self):
+        self.client.force_login(self.user)
+        url = reverse("store:cartpage", args=[self.product.pk])
+
+        response = self.client.post(url, {"quantity": 1}, follow=True)
+        self.assertEqual(
+            [str(m) for m in response.context["messages"]], ["Added 1 Phone to cart"]
+        )
+
+        # Reaching the cap is still reported as an addition to the cart
+        response = self.client.post(url, {"quantity": MAX_CART_QUANTITY}, follow=True)
+        self.assertEqual(
+            [str(m) for m in response.context["messages"]],
+            [f"Added {MAX_CART_QUANTITY} more to cart (Total: {MAX_CART_QUANTITY})"],
+        )
+
+    def test_increase_stops_at_cap(self):
+        self.client.force_login(self.user)
+        self.add(MAX_CART_QUANTITY)
+        item = CartProduct.objects.get(cart__user=self.user)
+
+        response = self.client.post(
+            reverse("store:update_cart_quantity", args=[item.pk]),
+            {"action": "increase"},
+            follow=True,
+        )
+
+        item.refresh_from_db()
+        self.assertEqual(item.quantity, MAX_CART_QUANTITY)
+        self.assertEqual(
+            [str(m) for m in response.context["messages"]],
+            [f"Maximum quantity is {MAX_CART_QUANTITY}"],
+        )
+
+    def test_decrease(self):
+        self.client.force_login(self.user)
+        self.add(2)
+        item = CartProduct.objects.get(cart__user=self.user)
+        url = reverse("store:update_cart_quantity", args=[item.pk])
+
+        self.client.post(url, {"action": "decrease"})
+        item.refresh_from_db()
+        self.assertEqual(item.quantity, 1)
+
+        self.client.post(url, {"action": "decrease"})
+        self.assertFalse(CartProduct.objects.filter(pk=item.pk).exists())
+
+    def test_decrease_keeps_item_increased_concurrently(self):
+        self.client.force_login(self.user)
+        self.add(1)
+        item = CartProduct.objects.get(cart__user=self.user)
+        delete = QuerySet.delete
+
+        def increase_then_delete(queryset):
+            # Another request increases the item right before the delete
+            CartProduct.objects.filter(pk=item.pk).update(quantity=2)
+            return delete(queryset)
+
+        with mock.patch.object(QuerySet, "delete", increase_then_delete):
+            self.client.post(
+                reverse("store:update_cart_quantity", args=[item.pk]), {"action": "decrease"}
+            )
+
+        item.refresh_from_db()
+        self.assertEqual(item.quantity, 1)
+
+    def test_fallback_without_returning(self):
+        # e.g. SQLite older than 3.35
+        manager = CartProduct.objects
+        with (
+            mock.patch.object(connection.features, "can_return_columns_from_insert", False),
+            mock.patch.object(
+                manager, "_add_product_fallback", wraps=manager._add_product_fallback
+            ) as fallback,
+        ):
+            self.assertEqual(self.add(2), (2, True))
+            self.assertEqual(self.add(MAX_CART_QUANTITY), (MAX_CART_QUANTITY, False))
+
+        self.assertEqual(fallback.call_count, 2)
+
+
+class HomePageTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user("buyer@example.com", "s3cret-pass")
+        cls.phone, cls.case = Product.objects.bulk_create(
+            Product(
+                name=name, description="", image=f"products/{name}.jpg", featured=True
+            )
+            for name in ("Phone", "Case")
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def test_cart_ids_for_logged_in_user(self):
+        CartProduct.objects.create(cart=self.user.cart, product=self.case)
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse("store:homepage"))
+
+        self.assertContains(
+            response,
+            f'<script id="cart-product-ids" type="application/json">[{self.case.pk}]</script>',
+        )
+        # The banner button is marked by the same script as the grids
+        self.assertNotContains(response, "Added</a>")
+        self.assertContains(response, f'data-cart-product-id="{self.phone.pk}"')
+
+    def test_no_cart_ids_for_visitors(self):
+        response = self.client.get(reverse("store:homepage"))
+
+        self.assertNotContains(response, 'id="cart-product-ids"')
+        self.assertNotContains(response, "data-cart-product-id")
+
+
+class AnonymousPageCacheTests(MediaTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user("buyer@example.com", "s3cret-pass")
+
+    def setUp(self):
+        super().setUp()
+        # A real image, so saving the product finds its variants' source
+        Product.objects.create(
+            name="Phone",
+            description="",
+            image=ContentFile(make_jpeg(), name="phone.jpg"),
+            featured=True,
+        )
+        cache.clear()
+
+    def get_home(self, **params):
+        return self.client.get(reverse("store:homepage"), params)
+
+    def test_visitors_share_one_cached_page(self):
+        first = self.get_home()
+        self.assertIsNotNone(cache.get(HOME_PAGE_CACHE_KEY))
+
+        with self.assertNumQueries(0):
+            second = self.get_home()
+
+        self.assertEqual(second.content, first.content)
+
+    def test_logged_in_user_gets_fresh_page(self):
+        self.get_home()
+        self.client.force_login(self.user)
+
+        response = self.get_home()
+
+        self.assertContains(response, 'id="cart-product-ids"')
+        self.assertNotEqual(response.content, cache.get(HOME_PAGE_CACHE_KEY))
+
+    def test_not_cached_with_query_string(self):
+        self.get_home(search="phone")
+
+        self.assertIsNone(cache.get(HOME_PAGE_CACHE_KEY))
+
+    def test_not_cached_with_pending_message(self):
+        self.client.cookies[CookieStorage.cookie_name] = "pending"
+
+        self.get_home()
+
+        self.assertIsNone(cache.get(HOME_PAGE_CACHE_KEY))
+
+    def test_cleared_when_product_changes(self):
+        self.get_home()
+
+        product = Product.objects.get()
+        product.name = "Tablet"
+        product.save()
+
+        self.assertIsNone(cache.get(HOME_PAGE_CACHE_KEY))
+        self.assertContains(self.get_home(), "Tablet")
+
+
+class SignupCartTests(TestCase):
+    def test_new_user_gets_cart(self):
+        user = CustomUser.objects.create_user("buyer@example.com", "s3cret-pass")
+
+        self.assertEqual(Cart.objects.filter(user=user).count(), 1)
+
+    def test_registering_creates_cart(self):
+        response = self.client.post(
+            reverse("accounts:registerpage"),
+            {
+                "first_name": "Sita",
+                "last_name": "Rai",
+                "email": "buyer@example.com",
+                "password1": "Sup3r-s3cret!",
+                "password2": "Sup3r-s3cret!",
+            },
+        )
+
+        self.assertRedirects(response, reverse("accounts:loginpage"))
+        self.assertTrue(Cart.objects.filter(user__email="buyer@example.com").exists())
+
+    def test_saving_existing_user_keeps_one_cart(self):
+        user = CustomUser.objects.create_user("buyer@example.com", "s3cret-pass")
+        user.first_name = "Sita"
+        user.save()
+
+        self.assertEqual(Cart.objects.filter(user=user).count(), 1)
+
+    def test_skipped_for_raw_save(self):
+        # loaddata saves with raw=True; fixtures bring their own carts
+        user = CustomUser(email="buyer@example.com")
+        user.save_base(raw=True)
+
+        self.assertFalse(Cart.objects.filter(user=user).exists())
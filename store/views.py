@@ -11,60 +11,270 @@ Key Concepts:
 - render: Combine template with context data to create HTML response
 """
 
-from decimal import Decimal
+import base64
+import binascii
+import logging
+from datetime import datetime
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
+from types import MappingProxyType
 from django.shortcuts import get_object_or_404, render, redirect
+from django.core.cache import cache
+from .caching import (
+    HOME_PAGE_CACHE_KEY,
+    HOME_PAGE_CACHE_TIMEOUT,
+    HOME_SECTIONS_CACHE_KEY,
+    HOME_SECTIONS_CACHE_TIMEOUT,
+    cache_for_anonymous,
+)
+from .context_processors import get_cart_product_ids
 from .forms import FilterProductForm
 from django.urls import reverse, reverse_lazy
-from .models import Product, Category, Cart, CartProduct
-from django.core.paginator import Paginator
+from .models import MAX_CART_QUANTITY, Product, Category, Cart, CartProduct
+from django.db.models import (
+    Case,
+    DecimalField,
+    Exists,
+    F,
+    IntegerField,
+    OuterRef,
+    Q,
+    Sum,
+    When,
+    Window,
+)
+from django.db.models.functions import Left, RowNumber
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
+from django.db import DatabaseError
+
+logger = logging.getLogger(__name__)
+
+
+# Product columns shown on product cards (home, shop, bestseller and cart pages)
+# The full description is NOT loaded: cards only show its first few words,
+# taken from the description_preview annotation (see _listing_products)
+LISTING_PRODUCT_FIELDS = ("id", "name", "price", "old_price", "image", "created_at")
+
+# The longest preview the card templates show is truncatechars:90
+# One extra character lets truncatechars still tell that the text was cut
+DESCRIPTION_PREVIEW_LENGTH = 91
+
+# Homepage section flags, and how many products each section shows
+HOME_SECTION_FLAGS = ("all_products", "featured", "new_arrivals", "top_selling")
+HOME_SECTION_SIZE = 12
+
+# Maximum number of products on the (unpaginated) bestseller page
+BESTSELLER_LIMIT = 48
+
+# Tax added to the cart subtotal (13% VAT), and the smallest currency unit
+# Parsed once at import instead of on every cart page
+TAX_RATE = Decimal("0.13")
+CENT = Decimal("0.01")
+
+# Products per shop page
+SHOP_PAGE_SIZE = 8
+
+# Shop page sort orders (sorting_key -> ORDER BY columns)
+# Every order ends with id, so no two products share a position and the
+# (value, id) pair of a product pinpoints where the next page starts
+# (see _seek). Each order is served by a Product index (see Meta.indexes).
+# A dict lookup replaces an if/elif chain over sorting_key;
+# MappingProxyType makes it read-only, so no request can change it
+SHOP_SORT_KEYS = MappingProxyType(
+    {
+        "latest": ("-created_at", "-id"),  # Newest first (default)
+        "oldest": ("created_at", "id"),  # Oldest first
+        "price_asc": ("price", "id"),  # Low to high
+        "price_dec": ("-price", "-id"),  # High to low (- means descending)
+    }
+)
+SHOP_DEFAULT_SORT = "latest"
 
 
 # ============================================================
-# HELPER FUNCTION
+# HELPER FUNCTIONS
 # ============================================================
-def _get_cart_product_ids(request):
+def _listing_products():
     """
-    Helper function to get list of product IDs currently in user's cart.
+    Product queryset for product cards (listings, not the detail page).
 
-    Purpose:
-        - Used to highlight "Added to Cart" products in product listings
-        - Shows which products are already in the cart
+    Returns:
+        - Products with only LISTING_PRODUCT_FIELDS loaded, plus
+          description_preview: the first DESCRIPTION_PREVIEW_LENGTH
+          characters of the description, cut by the database
+
+    Why?
+        - description is an unlimited TextField; loading it for every card
+          transfers the whole text only for the template to show ~90 chars
+    """
+    return Product.objects.only(*LISTING_PRODUCT_FIELDS).annotate(
+        description_preview=Left("description", DESCRIPTION_PREVIEW_LENGTH)
+    )
+
+
+def _section_rank(flag):
+    """
+    Position of a product within one homepage section, newest first.
+
+    Returns:
+        - 1 for the newest product with this flag, 2 for the next, ...
+        - None (NULL) for products without the flag
+    """
+    return Case(
+        When(
+            **{flag: True},
+            then=Window(
+                RowNumber(),
+                partition_by=[F(flag)],
+                order_by=F("created_at").desc(),
+            ),
+        ),
+        default=None,
+        output_field=IntegerField(),
+    )
+
+
+def _encode_cursor(product, sort_field):
+    """
+    Cursor pointing at a product in the shop listing.
+
+    Returns:
+        - URL-safe base64 of "<sort value>|<id>", e.g. the base64 of
+          "2026-10-14T09:30:00+00:00|42" when sorting by created_at
+    """
+    value = getattr(product, sort_field)
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    raw = f"{value}|{product.id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def _decode_cursor(cursor, sort_field):
+    """
+    Read a cursor made by _encode_cursor.
+
+    Returns:
+        - (sort value, id) tuple
+        - None if the cursor is missing or invalid (e.g. edited by hand or
+          made for another sort order); the listing then starts at page 1
+    """
+    if not cursor:
+        return None
+    try:
+        value, last_id = base64.urlsafe_b64decode(cursor).decode().rsplit("|", 1)
+        if sort_field == "created_at":
+            value = datetime.fromisoformat(value)
+        else:
+            value = Decimal(value)
+            # Decimal() also accepts "NaN" and "Infinity", which the
+            # price filter would reject with a ValidationError (500)
+            if not value.is_finite():
+                return None
+        return value, int(last_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError, InvalidOperation):
+        return None
+
+
+def _seek(products, ordering, cursor, forward=True):
+    """
+    Products after (or before) a cursor, in the listing's order.
 
     Parameters:
-        - request: HTTP request object containing user information
+        - products: Filtered product queryset
+        - ordering: ORDER BY columns from SHOP_SORT_KEYS, e.g. ("price", "id")
+        - cursor: (sort value, id) of the product to start from
+        - forward: True for the products after the cursor (next page),
+          False for those before it (previous page)
 
     Returns:
-        - List of product IDs (integers) that are in the user's cart
-        - Empty list [] if user is not logged in or has no cart
+        - Queryset ordered so that its first rows are the wanted page
+          (for forward=False the rows come nearest-first, i.e. reversed)
+
+    Why not OFFSET?
+        - OFFSET makes the database read and throw away every row of the
+          earlier pages, so page 500 is much slower than page 1
+        - "price > 10 OR (price = 10 AND id > 42)" starts reading the
+          (price, id) index right at the cursor, so every page is as fast
+          as the first one
+    """
+    sort_field, tie_field = (column.lstrip("-") for column in ordering)
+    descending = ordering[0].startswith("-")
+    if not forward:
+        # Walk the same order backwards from the cursor
+        descending = not descending
+        ordering = tuple(
+            column[1:] if column.startswith("-") else f"-{column}" for column in ordering
+        )
 
-    Logic Flow:
-        1. Check if user is authenticated (logged in)
-        2. If not logged in, return empty list
-        3. Get user's cart from database
-        4. If no cart exists, return empty list
-        5. Get all products in cart and extract their IDs
-        6. Return list of product IDs
+    value, last_id = cursor
+    lookup = "lt" if descending else "gt"
+    return products.filter(
+        Q(**{f"{sort_field}__{lookup}": value})
+        | Q(**{sort_field: value, f"{tie_field}__{lookup}": last_id})
+    ).order_by(*ordering)
+
+
+def _page_url(request, **cursor):
     """
-    if not request.user.is_authenticated:
-        return []
+    URL of another shop page: the current query string (filters, sorting)
+    with the pagination cursor replaced, e.g. _page_url(request, after=c).
+    """
+    params = request.GET.copy()
+    for key in ("after", "before", "page"):
+        params.pop(key, None)
+    params.update(cursor)
+    return f"?{params.urlencode()}"
+
 
-    # Try to get the cart for this user (returns None if doesn't exist)
-    cart = Cart.objects.filter(user=request.user).first()
-    if not cart:
-        return []
+def _home_sections():
+    """
+    Newest HOME_SECTION_SIZE products of every homepage section.
 
-    # Get all CartProduct entries for this cart and extract product IDs
-    # flat=True returns a simple list instead of tuples
-    return list(
-        CartProduct.objects.filter(cart=cart).values_list("product_id", flat=True)
+    Returns:
+        - Dict like {"featured": [product, ...], "top_selling": [...], ...}
+          with one key per HOME_SECTION_FLAGS entry, newest first
+
+    Query Explanation:
+        - One query fetches the newest HOME_SECTION_SIZE products of every
+          section, newest first
+        - ROW_NUMBER() (a window function) numbers each section's products;
+          only rows numbered <= HOME_SECTION_SIZE in some section are
+          returned, so the query size doesn't grow with the catalog
+        - The rows are then split into sections in Python, so a product that
+          is in several sections is only fetched once
+        - Only the columns product cards display are loaded
+    """
+    in_any_section = Q()
+    top_of_any_section = Q()
+    for flag in HOME_SECTION_FLAGS:
+        in_any_section |= Q(**{flag: True})
+        top_of_any_section |= Q(**{f"{flag}_rank__lte": HOME_SECTION_SIZE})
+
+    section_products = (
+        _listing_products()
+        .filter(in_any_section)
+        .annotate(**{f"{flag}_rank": _section_rank(flag) for flag in HOME_SECTION_FLAGS})
+        .filter(top_of_any_section)
+        .order_by("-created_at")
     )
 
+    # Split the rows into sections (each list keeps the newest-first order)
+    # A row can be in the result because of one section while being below
+    # the cut-off of another, hence the rank check
+    sections = {flag: [] for flag in HOME_SECTION_FLAGS}
+    for item in section_products:
+        for flag in HOME_SECTION_FLAGS:
+            rank = getattr(item, f"{flag}_rank")
+            if rank is not None and rank <= HOME_SECTION_SIZE:
+                sections[flag].append(item)
+
+    return sections
+
 
 # ============================================================
 # HOME PAGE VIEW
 # ============================================================
+@cache_for_anonymous(HOME_PAGE_CACHE_KEY, HOME_PAGE_CACHE_TIMEOUT)
 def home(request):
     """
     Home page view - Displays different product sections on homepage.
@@ -76,38 +286,45 @@ def home(request):
         - Show various product collections (featured, new arrivals, top selling)
         - Each section can display different products
 
-    Query Explanation:
-        - Product.objects.all(): Get all products from database
-        - .filter(featured=True): Only get products where featured=True
-        - .order_by("-created_at"): Sort by created_at in descending order
-                                    (- means descending, newest first)
+    Caching:
+        - The section products are cached for everyone (see _home_sections)
+        - Visitors who aren't logged in share one cached copy of the page
+          (see cache_for_anonymous in store/caching.py); it is cleared
+          whenever a product is saved or deleted
+        - Logged-in users share cached product grids ({% cache %} in
+          home.html); their "Added" buttons (grids and banner) are filled
+          in by a small script from cart_product_id_list
 
     Context Variables (sent to template):
-        - products: All products
         - all_products: Products marked as "all_products"
         - featured_products: Products marked as "featured"
         - new_arrivals_products: Products marked as "new_arrivals"
         - top_selling_products: Products marked as "top_selling"
-        - cart_product_ids: List of product IDs in user's cart
+        - cart_product_id_list: Sorted product IDs in the user's cart
+          (empty for visitors), embedded with json_script
         - featured/new_arrivals/top_selling: Backward-compatible aliases
     """
-    products = Product.objects.all().order_by("-created_at")
-    all_products = Product.objects.filter(all_products=True).order_by("-created_at")
-    featured_products = Product.objects.filter(featured=True).order_by("-created_at")
-    new_arrivals_products = Product.objects.filter(new_arrivals=True).order_by(
-        "-created_at"
-    )
-    top_selling_products = Product.objects.filter(top_selling=True).order_by(
-        "-created_at"
+    # Cached for everyone (cleared when a product changes, see
+    # store/signals.py), so most requests don't query products at all
+    sections = cache.get_or_set(
+        HOME_SECTIONS_CACHE_KEY, _home_sections, HOME_SECTIONS_CACHE_TIMEOUT
     )
 
+    all_products = sections["all_products"]
+    featured_products = sections["featured"]
+    new_arrivals_products = sections["new_arrivals"]
+    top_selling_products = sections["top_selling"]
+
     context = {
-        "products": products,
+        # Product IDs in the user's cart for the "Added" buttons script
+        # (json_script needs a list; cart_product_ids is a frozenset)
+        "cart_product_id_list": (
+            sorted(get_cart_product_ids(request)) if request.user.is_authenticated else []
+        ),
         "all_products": all_products,
         "featured_products": featured_products,
         "new_arrivals_products": new_arrivals_products,
         "top_selling_products": top_selling_products,
-        "cart_product_ids": _get_cart_product_ids(request),
         # Backwards-compatible names (in case templates still reference them)
         "featured": featured_products,
         "new_arrivals": new_arrivals_products,
@@ -130,7 +347,7 @@ def product(request):
         - Display all products with filtering options (name, category, price range)
         - Support search functionality
         - Sort products by different criteria
-        - Paginate results (8 products per page)
+        - Paginate results (8 products per page, keyset pagination)
 
     GET Parameters:
         - search: Search query from header search bar
@@ -139,97 +356,119 @@ def product(request):
         - min_price: Minimum price filter
         - max_price: Maximum price filter
         - sorting_key: How to sort products (price_asc, price_dec, latest, oldest)
-        - page: Page number for pagination
+        - after: Cursor of the last product on the previous page (next page link)
+        - before: Cursor of the first product on the next page (previous page link)
 
     Logic Flow:
         1. Get all products from database
         2. Copy GET parameters and handle search vs name parameter
-        3. Validate form data
+        3. Validate form data (invalid filters: no products)
         4. Apply filters (name, categories, price range)
-        5. Apply sorting
-        6. Check if filters returned no results
-        7. Paginate results (8 per page)
+        5. Sort and fetch one page (8 products), starting at the cursor
+        6. Check if filters returned no results (empty first page)
+        7. Build next/previous links that keep the current filters
         8. Send data to template
     """
-    products = Product.objects.all().order_by("-created_at")
+    products = _listing_products()
+    sorting_key = None  # Default order unless the form says otherwise
 
     # Handle both header search (?search=...) and filter form (?name=...)
-    # Copy GET data so we can modify it without affecting the original
-    data = request.GET.copy()
     # Header search uses `search=...` while FilterProductForm expects `name=...`
+    # request.GET is read-only, so it is only copied in that case
+    data = request.GET
     if data.get("search") and not data.get("name"):
-        data["name"] = data.get("search")
+        data = data.copy()
+        data["name"] = data["search"]
 
     filter_form = FilterProductForm(data)
     no_results = False  # Flag to show "No products found" message
+    filters_applied = False
 
     # Check if form data is valid (correct data types, within limits, etc.)
     if filter_form.is_valid():
-        # Extract cleaned (validated) data from form
-        name = filter_form.cleaned_data.get("name")
-        categories = filter_form.cleaned_data.get("categories")
-        min_price = filter_form.cleaned_data.get("min_price")
-        max_price = filter_form.cleaned_data.get("max_price")
-        sorting_key = filter_form.cleaned_data.get("sorting_key")
+        # Cleaned (validated) data from the form, as one typed object
+        filters = filter_form.get_filters()
+        sorting_key = filters.sorting_key
 
         # Apply name filter (case-insensitive partial match)
         # icontains: case-insensitive contains ("iPhone" matches "iphone 12")
-        if name:
-            products = products.filter(name__icontains=name)
+        # On PostgreSQL this uses the product_name_trgm trigram index
+        # (store/migrations/0010_product_name_trigram_index.py)
+        if filters.name:
+            products = products.filter(name__icontains=filters.name)
 
         # Apply category filter
-        # __in: SQL IN operator (category is in the list of selected categories)
-        # .distinct(): Remove duplicate products (since ManyToMany can create duplicates)
-        if categories:
-            products = products.filter(category__in=categories).distinct()
+        # EXISTS subquery: keep products with at least one selected category
+        # (joining category__in would repeat a product once per matching
+        # category, and .distinct() would then have to sort the whole result)
+        if filters.categories:
+            products = products.filter(
+                Exists(
+                    Product.category.through.objects.filter(
+                        product_id=OuterRef("pk"), category__in=filters.categories
+                    )
+                )
+            )
 
         # Apply minimum price filter
         # __gte: Greater Than or Equal to
-        if min_price is not None:
-            products = products.filter(price__gte=min_price)
+        if filters.min_price is not None:
+            products = products.filter(price__gte=filters.min_price)
 
         # Apply maximum price filter
         # __lte: Less Than or Equal to
-        if max_price is not None:
-            products = products.filter(price__lte=max_price)
-
-        # Apply sorting based on user selection
-        if sorting_key:
-            if sorting_key == "price_asc":
-                products = products.order_by("price")  # Low to high
-            elif sorting_key == "price_dec":
-                products = products.order_by(
-                    "-price"
-                )  # High to low (- means descending)
-            elif sorting_key == "latest":
-                products = products.order_by("-created_at")  # Newest first
-            elif sorting_key == "oldest":
-                products = products.order_by("created_at")  # Oldest first
-            # "popularity" left as default for now (no separate field)
-
-        # Check if filters were applied but returned no results
-        if (
-            name or categories or min_price or max_price or sorting_key
-        ) and not products.exists():
-            no_results = True
-            # Keep empty queryset so the template can show "No products found"
-
-    # Pagination: Split products into pages of 8 items each
-    # Paginator creates page objects from the products queryset
-    paginated_products = Paginator(products, 8)  # 8 products per page
-    page_number = request.GET.get("page")  # Get current page number from URL
-    page_obj = paginated_products.get_page(page_number)  # Get the page object
-    totalpage = page_obj.paginator.num_pages  # Total number of pages
+        if filters.max_price is not None:
+            products = products.filter(price__lte=filters.max_price)
+
+        # Were any filters applied? (checked against the page below)
+        filters_applied = filters.applied
+    else:
+        # Invalid filters (e.g. ?min_price=abc): show no products instead of
+        # silently listing the whole catalog; .none() never queries the
+        # database, so the request costs nothing
+        products = products.none()
+        filters_applied = True
+
+    # Keyset pagination: ?after=<cursor> is the next page, ?before=<cursor>
+    # the previous one (see _seek). SHOP_PAGE_SIZE + 1 rows are fetched: the
+    # extra row only tells whether there is another page in that direction.
+    ordering = SHOP_SORT_KEYS.get(sorting_key or SHOP_DEFAULT_SORT)
+    sort_field = ordering[0].lstrip("-")
+    after = _decode_cursor(request.GET.get("after"), sort_field)
+    before = _decode_cursor(request.GET.get("before"), sort_field)
+
+    if before and not after:
+        # Previous page: read backwards from the cursor, then flip the rows
+        # back into display order
+        rows = list(_seek(products, ordering, before, forward=False)[: SHOP_PAGE_SIZE + 1])
+        has_previous = len(rows) > SHOP_PAGE_SIZE
+        rows = rows[:SHOP_PAGE_SIZE][::-1]
+        has_next = True
+    else:
+        page = _seek(products, ordering, after) if after else products.order_by(*ordering)
+        rows = list(page[: SHOP_PAGE_SIZE + 1])
+        has_next = len(rows) > SHOP_PAGE_SIZE
+        rows = rows[:SHOP_PAGE_SIZE]
+        has_previous = after is not None
+
+    # Filters applied but the first page is empty: no product matches
+    # (decided from the fetched page instead of an extra EXISTS query)
+    if filters_applied and not rows and not (after or before):
+        no_results = True
+
+    next_url = previous_url = None
+    if rows:
+        if has_next:
+            next_url = _page_url(request, after=_encode_cursor(rows[-1], sort_field))
+        if has_previous:
+            previous_url = _page_url(request, before=_encode_cursor(rows[0], sort_field))
 
     context = {
-        "products": page_obj,  # Current page of products
+        "products": rows,  # Current page of products
         "filter_form": filter_form,  # Form with current filter values
         "no_results": no_results,  # Flag for "no results" message
-        "lastpage": totalpage,  # Total number of pages
-        "totalpagelist": [
-            n + 1 for n in range(totalpage)
-        ],  # [1, 2, 3, ...] for pagination
-        "cart_product_ids": _get_cart_product_ids(request),  # Products in cart
+        "next_url": next_url,  # Link to the next page (None on the last page)
+        "previous_url": previous_url,  # Link to the previous page (None on the first)
     }
     return render(request, "store/shop.html", context)
 
@@ -250,13 +489,15 @@ def bestseller(request):
 
     Note:
         - Uses same template as product() view but with filtered products
-        - No pagination or filtering applied (shows all top sellers)
+        - No pagination or filtering applied (shows the newest
+          BESTSELLER_LIMIT top sellers)
     """
-    products = Product.objects.filter(top_selling=True).order_by("-created_at")
+    products = _listing_products().filter(top_selling=True).order_by("-created_at")[
+        :BESTSELLER_LIMIT
+    ]
 
     context = {
         "products": products,
-        "cart_product_ids": _get_cart_product_ids(request),
     }
     return render(request, "store/shop.html", context)
 
@@ -287,7 +528,6 @@ def product_detail(request, pk: int):
     product = get_object_or_404(Product, pk=pk)  # Get product or show 404 error
     context = {
         "product": product,
-        "cart_product_ids": _get_cart_product_ids(request),  # To show "in cart" status
     }
     return render(request, "store/product_detail.html", context)
 
@@ -318,16 +558,15 @@ def add_to_cart(request, pk):
         1. Check if user is authenticated (decorator handles this)
         2. Get the product or show 404 error
         3. Get quantity from POST data (default 1)
-        4. Get or create cart for this user
-        5. Get or create CartProduct entry
-        6. If product already in cart, add to existing quantity
-        7. If new product, add with specified quantity
-        8. Show appropriate message
-        9. Redirect to previous page (or product detail page)
+        4. Add it to the user's cart (new row, or added to the existing one)
+        5. If the user had no cart yet, create it and add again
+        6. Show appropriate message
+        7. Redirect to previous page (or product detail page)
 
     Database Operations:
-        - get_or_create(): Try to get record, if doesn't exist, create it
-          Returns: (object, created) where created is True if new, False if existed
+        - CartProduct.objects.add_product(): One INSERT ... ON CONFLICT
+          DO UPDATE ("upsert") statement, returns the new quantity and
+          whether the product was new in the cart
 
     Messages:
         - messages.success(): Green success message shown to user
@@ -339,7 +578,8 @@ def add_to_cart(request, pk):
         return redirect("accounts:loginpage")
 
     # Get the product or return 404 error if not found
-    product = get_object_or_404(Product, pk=pk)
+    # Only id (for the cart row) and name (for the message) are needed
+    product = get_object_or_404(Product.objects.only("id", "name"), pk=pk)
     logged_in_user = request.user
 
     # Get quantity from POST data, default to 1
@@ -349,33 +589,26 @@ def add_to_cart(request, pk):
             quantity = int(request.POST.get("quantity", 1))
             if quantity < 1:
                 quantity = 1
-            elif quantity > 99:
-                quantity = 99
+            elif quantity > MAX_CART_QUANTITY:
+                quantity = MAX_CART_QUANTITY
         except (ValueError, TypeError):
             quantity = 1
 
-    # Get user's cart, or create one if they don't have a cart yet
-    # get_or_create returns (cart_object, created_boolean)
-    # We only need cart_object, so we use _ for the boolean
-    cart, _ = Cart.objects.get_or_create(user=logged_in_user)
-
-    # Try to get existing CartProduct entry for this cart and product
-    # If doesn't exist, create it with specified quantity (defaults parameter)
-    cart_item, created = CartProduct.objects.get_or_create(
-        cart=cart,
-        product=product,
-        defaults={"quantity": quantity},  # Only used if creating new entry
-    )
+    # Add to the cart in one statement: a new product gets a cart row, a
+    # product already in the cart gets its quantity increased (capped at
+    # MAX_CART_QUANTITY) - see CartProductManager.add_product
+    added = CartProduct.objects.add_product(logged_in_user.pk, product.pk, quantity)
+    if added is None:
+        # User has no cart yet; every user gets one when they sign up
+        # (store/signals.py), so this is only a fallback, e.g. for users
+        # added with bulk_create_users (which doesn't send signals)
+        Cart.objects.get_or_create(user=logged_in_user)
+        added = CartProduct.objects.add_product(logged_in_user.pk, product.pk, quantity)
+    new_total, created = added
 
     if not created:
-        # Product was already in cart, so add to existing quantity
-        cart_item.quantity += quantity
-        cart_item.save(
-            update_fields=["quantity"]
-        )  # Only save quantity field (more efficient)
-        messages.info(
-            request, f"Added {quantity} more to cart (Total: {cart_item.quantity})"
-        )
+        # Product was already in cart, so the quantity was added to it
+        messages.info(request, f"Added {quantity} more to cart (Total: {new_total})")
     else:
         # New product was added to cart
         messages.success(request, f"Added {quantity} {product.name} to cart")
@@ -414,29 +647,67 @@ def cart(request):
 
     user_cart, _ = Cart.objects.get_or_create(user=request.user)
     try:
-        cart_product = CartProduct.objects.filter(cart=user_cart)
-
-        # Calculate subtotal (sum of all item prices)
-        subtotal = 0
-        for cart_item in cart_product:
-            subtotal += cart_item.get_total_price
+        # select_related("product"): JOIN the product into the same query
+        # (the template and get_total_price use item.product on every row)
+        # prefetch_related: load all rows' categories in one extra query
+        # instead of one query per row for item.product.category.all
+        # list(): run the query once; the rows below are used for the
+        # "cart is empty" check and the template
+        # only(): of the product, load just the product card columns
+        # (LISTING_PRODUCT_FIELDS), not the whole description
+        items = list(
+            CartProduct.objects.filter(cart=user_cart)
+            .select_related("product")
+            .only(
+                "id",
+                "quantity",
+                "added_at",
+                "product",
+                *(f"product__{field}" for field in LISTING_PRODUCT_FIELDS),
+            )
+            .prefetch_related("product__category")
+            .order_by("-added_at")  # Most recently added first
+        )
 
-        # Calculate tax (13%)
-        tax = subtotal * Decimal("0.13")
+        # Calculate subtotal (sum of quantity x price over all items)
+        # Computed by the database: SUM(quantity * price) returns one number
+        # instead of multiplying every row in Python; the rows above are
+        # only used for rendering
+        # An empty cart skips the query and shows 0.00
+        # quantize: round to whole paisa (SQLite returns the sum unrounded)
+        subtotal = Decimal("0.00")
+        if items:
+            # "or subtotal": the cart may have been emptied in between
+            # (SUM over no rows is NULL)
+            subtotal = (
+                CartProduct.objects.filter(cart=user_cart).aggregate(
+                    subtotal=Sum(
+                        F("quantity") * F("product__price"),
+                        output_field=DecimalField(max_digits=17, decimal_places=2),
+                    )
+                )["subtotal"]
+                or subtotal
+            ).quantize(CENT)
+
+        # Calculate tax (13%), rounded to whole paisa
+        # ROUND_HALF_UP: same rounding as floatformat in the template, so
+        # the shown tax and total always add up
+        tax = (subtotal * TAX_RATE).quantize(CENT, rounding=ROUND_HALF_UP)
 
         # Calculate total (subtotal + tax)
         total = subtotal + tax
 
-    except Exception as e:
+    except DatabaseError:
+        logger.exception("Loading cart failed for user %s", request.user.pk)
         messages.error(request, "Something went wrong loading your cart")
         return redirect("store:homepage")
 
     context = {
-        "products": cart_product,
+        "products": items,
         "subtotal": subtotal,  # Cart subtotal
         "tax": tax,  # 13% tax
         "total": total,  # Final total with tax
-        "cart_items": cart_product.exists(),  # Boolean to check if cart has items
+        "cart_items": bool(items),  # Boolean to check if cart has items
     }
 
     return render(
@@ -472,8 +743,8 @@ def remove_from_cart(request, pk):
             messages.success(request, "Cart item deleted successfully.")
         except CartProduct.DoesNotExist:
             messages.error(request, "Cart item doesn't exist or doesn't belong to you.")
-        except Exception as e:
-            print(e)
+        except DatabaseError:
+            logger.exception("Removing cart item %s failed", pk)
             messages.error(request, "Removing item from cart failed.")
 
     return redirect("store:cart")
@@ -502,35 +773,47 @@ def update_cart_quantity(request, pk):
         - If action is 'increase', add 1 to quantity
         - If action is 'decrease', subtract 1 from quantity
         - If quantity becomes 0 or less, delete the item
-        - Maximum quantity is 99
+        - Maximum quantity is MAX_CART_QUANTITY (99)
     """
     if request.method == "POST":
         try:
-            # Get the cart item and verify it belongs to the current user's cart
-            cart_item = CartProduct.objects.get(pk=pk, cart__user=request.user)
+            # Only the current user's cart items can be changed
+            user_items = CartProduct.objects.filter(pk=pk, cart__user=request.user)
             action = request.POST.get("action")
 
+            # Each change is a single UPDATE ... SET quantity = quantity +/- 1
+            # (F expression), with the 1 to MAX_CART_QUANTITY limit in its
+            # WHERE clause, so it is atomic and concurrent clicks can't push
+            # it past the limit
+            # update() returns the number of changed rows (0 or 1)
             if action == "increase":
-                if cart_item.quantity < 99:
-                    cart_item.quantity += 1
-                    cart_item.save(update_fields=["quantity"])
+                if user_items.filter(quantity__lt=MAX_CART_QUANTITY).update(
+                    quantity=F("quantity") + 1
+                ):
                     messages.success(request, "Quantity increased")
+                elif user_items.exists():
+                    messages.warning(request, f"Maximum quantity is {MAX_CART_QUANTITY}")
                 else:
-                    messages.warning(request, "Maximum quantity is 99")
+                    raise CartProduct.DoesNotExist
             elif action == "decrease":
-                if cart_item.quantity > 1:
-                    cart_item.quantity -= 1
-                    cart_item.save(update_fields=["quantity"])
+                decrease = user_items.filter(quantity__gt=1)
+                if decrease.update(quantity=F("quantity") - 1):
                     messages.success(request, "Quantity decreased")
-                else:
+                elif user_items.filter(quantity__lte=1).delete()[0]:
                     # If quantity is 1 and user decreases, remove item
-                    cart_item.delete()
+                    # (only while it is still 1, so an increase that lands
+                    # between the two statements doesn't lose the item)
                     messages.success(request, "Item removed from cart")
+                elif decrease.update(quantity=F("quantity") - 1):
+                    # That concurrent increase happened: decrease it instead
+                    messages.success(request, "Quantity decreased")
+                else:
+                    raise CartProduct.DoesNotExist
 
         except CartProduct.DoesNotExist:
             messages.error(request, "Cart item doesn't exist or doesn't belong to you.")
-        except Exception as e:
-            print(e)
+        except DatabaseError:
+            logger.exception("Updating cart item %s failed", pk)
             messages.error(request, "Updating cart quantity failed.")
 
     return redirect("store:cart")